@@ -3,24 +3,35 @@
 Provider priority (highest to lowest):
   1. Brave Search — fast REST API, deterministic; requires BRAVE_API_KEY.
   2. SearXNG  — free metasearch, rotates multiple public instances.
-  3. DuckDuckGo — free, scraping-based; retried with exponential backoff.
+  3. DuckDuckGo — free, scraping-based; retried with jittered exponential backoff.
 
 All providers share a common interface: ``search(query, max_results) -> list[str]``.
 The ``SearchProviderChain`` tries each provider in order and returns the first
-non-empty result set.  If every provider fails the chain returns ``[]``.
+non-empty result set.  If every provider fails the chain returns ``[]``.  With
+``SEARCH_CHAIN_CONCURRENT`` set, all providers are queried at once and the same
+priority order picks the winner.
 """
 
 from __future__ import annotations
 
+import random
+import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
 
 import httpx
-from duckduckgo_search import DDGS
-from duckduckgo_search.exceptions import DuckDuckGoSearchException, RatelimitException
+import orjson
 
 from backend.config import settings
 
+# duckduckgo_search adds ~80 ms to import, so it is loaded on the first
+# DuckDuckGo search rather than with this module.
+DDGS: Any = None
+
 # ---------------------------------------------------------------------------
 # Reliable public SearXNG instances (tried in order on failure)
 # ---------------------------------------------------------------------------
@@ -31,6 +42,10 @@ _SEARXNG_FALLBACK_INSTANCES = [
     "https://searx.tiekoetter.com",
 ]
 
+# At most this many SearXNG instances are queried at once: the one being waited
+# on plus one hedge.  The fallbacks are volunteer-run public servers.
+_SEARXNG_MAX_IN_FLIGHT = 2
+
 _BROWSER_UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -50,10 +65,26 @@ def _normalise_query(query: str) -> str:
     return q
 
 
+# Placeholder queries the planner sometimes emits; searching them is pointless.
+_EMPTY_QUERIES = frozenset({"", "n/a", "none", "null"})
+
+# Absolute http(s) URLs with no whitespace or markup characters.
+_HTTP_URL_RE = re.compile(r"https?://[^\s<>\"']+")
+
+
 # ---------------------------------------------------------------------------
 # Abstract base
 # ---------------------------------------------------------------------------
 
+class SearchFailed(list[str]):
+    """Empty result returned by a provider whose backend errored.
+
+    It compares equal to ``[]``, so callers that only want URLs can ignore
+    the difference; :class:`SearchProviderChain` uses it to tell an outage
+    from a query that simply has no hits.
+    """
+
+
 class SearchProvider(ABC):
     """Abstract base class for a single search provider."""
 
@@ -64,23 +95,117 @@ class SearchProvider(ABC):
 
     @abstractmethod
     def search(self, query: str, max_results: int = 5) -> list[str]:
-        """Return a list of URLs.  Must return ``[]`` (not raise) on failure."""
+        """Return a list of URLs.
+
+        Must not raise: return ``[]`` when the backend found nothing and
+        :class:`SearchFailed` when the request itself failed.
+        """
+
+
+class _HTTPSearchProvider(SearchProvider):
+    """Base for providers that call a JSON API over a pooled ``httpx.Client``.
+
+    Pass *client* to share one connection pool between providers (the caller
+    then owns and closes it); otherwise the provider opens its own on first
+    use and closes it in :meth:`close`.
+    """
+
+    def __init__(self, client: httpx.Client | None = None) -> None:
+        self._client = client
+        self._owns_client = client is None
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = _new_client()
+        return self._client
+
+    def close(self) -> None:
+        """Close the provider's own client; a shared client is left open."""
+        if self._owns_client and self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> _HTTPSearchProvider:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class _InFlight:
+    """Background futures that may outlive the call that started them.
+
+    ``close()`` methods call :meth:`wait` so nothing still running touches a
+    client after it is closed.
+    """
+
+    def __init__(self) -> None:
+        self._futures: set[Future[list[str]]] = set()
+        self._lock = threading.Lock()
+
+    def track(self, future: Future[list[str]]) -> None:
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+
+    def _discard(self, future: Future[list[str]]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def wait(self) -> None:
+        with self._lock:
+            outstanding = list(self._futures)
+        wait(outstanding)
+
+
+def _new_client() -> httpx.Client:
+    """Return a keep-alive client for the HTTP search providers.
+
+    HTTP/2 is used when the ``httpx[http2]`` extra is installed, so concurrent
+    requests to one host multiplex over a single connection.
+    """
+    try:
+        import h2  # noqa: F401, PLC0415
+
+        http2 = True
+    except ImportError:  # httpx[http2] extra not installed
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        timeout=settings.search_provider_timeout,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Brave Search provider (preferred — deterministic, fast REST API)
 # ---------------------------------------------------------------------------
 
-class BraveSearchProvider(SearchProvider):
+class BraveSearchProvider(_HTTPSearchProvider):
     """Brave Search REST API (free tier: 2 000 queries/month).
 
-    Skipped if ``settings.brave_api_key`` is empty.
+    Skipped if ``settings.brave_api_key`` is empty.  The keep-alive client is
+    reused across searches so repeated queries skip the TCP+TLS handshake.
     """
 
+    def __init__(self, client: httpx.Client | None = None) -> None:
+        super().__init__(client)
+        self._headers: dict[str, str] | None = None
+
     @property
     def name(self) -> str:
         return "Brave"
 
+    def _request_headers(self, api_key: str) -> dict[str, str]:
+        """Return the request headers, rebuilt only if the API key changed."""
+        if self._headers is None or self._headers["X-Subscription-Token"] != api_key:
+            self._headers = {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip",
+                "X-Subscription-Token": api_key,
+            }
+        return self._headers
+
     def search(self, query: str, max_results: int = 5) -> list[str]:
         api_key = settings.brave_api_key
         if not api_key:
@@ -88,21 +213,16 @@ class BraveSearchProvider(SearchProvider):
 
         query = _normalise_query(query)
         try:
-            with httpx.Client(timeout=settings.search_provider_timeout) as client:
-                resp = client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": max_results},
-                    headers={
-                        "Accept": "application/json",
-                        "Accept-Encoding": "gzip",
-                        "X-Subscription-Token": api_key,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = self._get_client().get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": query, "count": max_results},
+                headers=self._request_headers(api_key),
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
         except Exception as exc:
             print(f"[Brave] request failed: {exc}")
-            return []
+            return SearchFailed()
 
         results = [
             item["url"]
@@ -118,7 +238,7 @@ class BraveSearchProvider(SearchProvider):
 # SearXNG provider
 # ---------------------------------------------------------------------------
 
-class SearXNGProvider(SearchProvider):
+class SearXNGProvider(_HTTPSearchProvider):
     """Hit a SearXNG JSON endpoint.
 
     Tries the configured base URL first (`settings.searxng_base_url`), then
@@ -126,13 +246,26 @@ class SearXNGProvider(SearchProvider):
 
     Each instance is queried with a tight ``searxng_instance_timeout`` (default
     5 s) so dead or rate-limited instances fail fast rather than blocking for
-    the full ``search_provider_timeout``.
+    the full ``search_provider_timeout``.  The next instance starts when one
+    fails or comes back empty, or as a hedge once the current one has been
+    silent for ``searxng_hedge_delay`` seconds; no more than
+    ``_SEARXNG_MAX_IN_FLIGHT`` run at once.  A healthy primary is the only
+    instance contacted.
     """
 
+    def __init__(self, client: httpx.Client | None = None) -> None:
+        super().__init__(client)
+        self._in_flight = _InFlight()  # hedges still running after search() returned
+
     @property
     def name(self) -> str:
         return "SearXNG"
 
+    def close(self) -> None:
+        """Wait for outstanding hedged requests, then close the client."""
+        self._in_flight.wait()
+        super().close()
+
     def _query_instance(
         self,
         client: httpx.Client,
@@ -151,9 +284,12 @@ class SearXNGProvider(SearchProvider):
                 "Accept": "application/json, text/javascript, */*",
                 "User-Agent": _BROWSER_UA,
             },
+            # Use the shorter per-instance timeout so dead nodes fail fast.
+            timeout=settings.searxng_instance_timeout,
+            follow_redirects=True,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         results: list[str] = []
         for item in data.get("results", []):
             url = item.get("url") or item.get("href")
@@ -171,31 +307,115 @@ class SearXNGProvider(SearchProvider):
             u for u in _SEARXNG_FALLBACK_INSTANCES if u.rstrip("/") != primary
         ]
 
-        # Use the shorter per-instance timeout so dead nodes fail fast.
-        with httpx.Client(
-            timeout=settings.searxng_instance_timeout,
-            follow_redirects=True,
-        ) as client:
-            for base in instances:
-                try:
-                    urls = self._query_instance(client, base, query, max_results)
+        client = self._get_client()
+        remaining = iter(instances)
+        pending: dict[Future[list[str]], str] = {}  # in start order
+        answered = False  # some instance replied, even if with no results
+        pool = ThreadPoolExecutor(max_workers=_SEARXNG_MAX_IN_FLIGHT)
+        try:
+            while True:
+                # Start one more instance: the first, a replacement for one that
+                # just failed, or a hedge for one that is slow to answer.
+                base = next(remaining, None) if len(pending) < _SEARXNG_MAX_IN_FLIGHT else None
+                if base is not None:
+                    future = pool.submit(self._query_instance, client, base, query, max_results)
+                    self._in_flight.track(future)
+                    pending[future] = base
+                if not pending:
+                    break
+
+                can_hedge = len(pending) < _SEARXNG_MAX_IN_FLIGHT and base is not None
+                done, _ = wait(
+                    pending,
+                    timeout=settings.searxng_hedge_delay if can_hedge else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in [f for f in pending if f in done]:
+                    base = pending.pop(future)
+                    try:
+                        urls = future.result()
+                    except Exception as exc:
+                        print(f"[SearXNG] {base} failed: {exc!r:.120}, trying next instance.")
+                        continue
+                    answered = True
                     if urls:
                         print(f"[SearXNG] ✓ {base} → {len(urls)} result(s).")
                         return urls
                     print(f"[SearXNG] {base} returned 0 results, trying next instance.")
-                except Exception as exc:
-                    print(f"[SearXNG] {base} failed: {exc!r:.120}, trying next instance.")
+        finally:
+            # A hedge still running finishes in the background; close() waits
+            # for it before closing the client.
+            pool.shutdown(wait=False)
 
         print("[SearXNG] all instances exhausted.")
-        return []
+        return [] if answered else SearchFailed()
 
 
 # ---------------------------------------------------------------------------
 # DuckDuckGo provider (with exponential backoff)
 # ---------------------------------------------------------------------------
 
+class _TTLCache:
+    """Bounded LRU mapping whose entries expire *ttl* seconds after insertion.
+
+    Results are held as tuples, so a cached entry can never be mutated by a
+    caller that edits the list it was handed.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[tuple[str, int], tuple[float, tuple[str, ...]]] = OrderedDict()
+
+    def get(self, key: tuple[str, int]) -> tuple[str, ...] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: tuple[str, int], value: tuple[str, ...]) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+# Older duckduckgo_search versions raise a generic error whose message names
+# the rate limit ("202 Ratelimit", "rate limit", "rate-limited", ...).
+_RATELIMIT_RE = re.compile(r"\b202\b|rate[- ]?limit", re.IGNORECASE)
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after\D{0,3}(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def _next_retry_delay(prev: float, exc: Exception) -> float:
+    """Return the next rate-limit backoff in seconds after a *prev*-second wait.
+
+    Uses decorrelated jitter, ``min(cap, uniform(base, prev * 3))``, so
+    concurrent agents drift apart instead of retrying in lock-step.  A
+    ``Retry-After`` value in the exception message takes precedence.
+    """
+    cap = settings.search_retry_max_delay
+    hint = _RETRY_AFTER_RE.search(str(exc))
+    if hint:
+        return min(cap, float(hint.group(1)))
+    base = settings.search_retry_base_delay
+    return min(cap, random.uniform(base, max(base, prev * 3)))
+
+
 class DuckDuckGoProvider(SearchProvider):
-    """Wrapper around ``duckduckgo_search.DDGS`` with retry on rate-limit."""
+    """Wrapper around ``duckduckgo_search.DDGS`` with retry on rate-limit.
+
+    Non-empty result lists are cached for five minutes per
+    ``(query, max_results)``, so an agent re-issuing the same search neither
+    waits on DDG nor spends its rate limit.
+    """
+
+    def __init__(self) -> None:
+        self._cache = _TTLCache()
 
     @property
     def name(self) -> str:
@@ -203,66 +423,221 @@ class DuckDuckGoProvider(SearchProvider):
 
     def search(self, query: str, max_results: int = 5) -> list[str]:
         query = _normalise_query(query)
-        base_delay = settings.search_retry_base_delay
+        key = (query, max_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            print(f"[DuckDuckGo] ✓ {len(cached)} cached result(s).")
+            return list(cached)
+
+        global DDGS
+        if DDGS is None:
+            from duckduckgo_search import DDGS  # noqa: PLC0415
+
+        try:
+            # One session for every attempt, so retries reuse its connection.
+            with DDGS() as ddgs:
+                urls = self._text_with_retries(ddgs, query, max_results)
+        except Exception as exc:
+            print(f"[DuckDuckGo] error: {exc}")
+            return SearchFailed()
+        if urls:
+            print(f"[DuckDuckGo] ✓ {len(urls)} result(s).")
+            self._cache.put(key, tuple(urls))
+        return urls
+
+    def _text_with_retries(self, ddgs: Any, query: str, max_results: int) -> list[str]:
+        """Run ``ddgs.text`` with backoff on rate limits.
+
+        Returns :class:`SearchFailed` once retries run out or on any other error.
+        """
+        from duckduckgo_search.exceptions import (  # noqa: PLC0415
+            DuckDuckGoSearchException,
+            RatelimitException,
+        )
+
+        delay = settings.search_retry_base_delay
         max_retries = settings.search_retry_max
 
         for attempt in range(max_retries + 1):
             try:
-                with DDGS() as ddgs:
-                    results = ddgs.text(query, max_results=max_results)
-                urls = [r["href"] for r in results if "href" in r]
-                if urls:
-                    print(f"[DuckDuckGo] ✓ {len(urls)} result(s).")
-                return urls
-            except RatelimitException:
+                results = ddgs.text(query, max_results=max_results)
+                return [r["href"] for r in results if "href" in r]
+            except RatelimitException as exc:
                 if attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)
+                    delay = _next_retry_delay(delay, exc)
                     print(
                         f"[DuckDuckGo] rate-limited (attempt {attempt + 1}/{max_retries}); "
-                        f"retrying in {delay:.0f}s …"
+                        f"retrying in {delay:.1f}s …"
                     )
                     time.sleep(delay)
                 else:
                     print(f"[DuckDuckGo] exhausted {max_retries} retries — rate-limited.")
-                    return []
+                    return SearchFailed()
             except DuckDuckGoSearchException as exc:
                 print(f"[DuckDuckGo] search error: {exc}")
-                return []
+                return SearchFailed()
             except Exception as exc:
                 msg = str(exc)
-                is_ratelimit = "202" in msg or "Ratelimit" in msg or "ratelimit" in msg.lower()
-                if is_ratelimit and attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)
+                if _RATELIMIT_RE.search(msg) and attempt < max_retries:
+                    delay = _next_retry_delay(delay, exc)
                     print(
                         f"[DuckDuckGo] rate-limit detected (attempt {attempt + 1}/{max_retries}); "
-                        f"retrying in {delay:.0f}s …"
+                        f"retrying in {delay:.1f}s …"
                     )
                     time.sleep(delay)
                     continue
                 print(f"[DuckDuckGo] error: {exc}")
-                return []
+                return SearchFailed()
 
-        return []
+        return SearchFailed()
 
 
 # ---------------------------------------------------------------------------
 # Provider chain
 # ---------------------------------------------------------------------------
 
+def _http_urls(urls: list[str]) -> list[str]:
+    """Drop anything that is not a plain http(s) URL (``javascript:``, junk)."""
+    return [url for url in urls if _HTTP_URL_RE.fullmatch(url)]
+
+
+class _Breaker:
+    """Consecutive-failure circuit breaker for one provider in a chain.
+
+    After *threshold* failed requests in a row (:class:`SearchFailed`, not a
+    mere lack of hits) the provider is skipped for *cooldown* seconds.  The
+    first call after that is a probe: a result closes the breaker, another
+    failure re-opens it straight away.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()  # concurrent chains record from worker threads
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self._failures >= self._threshold:
+                self._open_until = time.monotonic() + self._cooldown
+
+
+def _consult(
+    provider: SearchProvider, breaker: _Breaker, query: str, max_results: int
+) -> list[str]:
+    """Run *provider* and report the outcome to *breaker*; never raises.
+
+    A provider that raises despite the contract counts as a failure, so one
+    broken provider cannot abort the chain.
+    """
+    try:
+        found = provider.search(query, max_results=max_results)
+    except Exception as exc:
+        print(f"[search chain] {provider.name} raised: {exc!r:.120}")
+        found = SearchFailed()
+    breaker.record(not isinstance(found, SearchFailed))
+    return found
+
+
 class SearchProviderChain:
-    """Try providers in order; return the first non-empty result list."""
+    """Try providers in order; return the first non-empty result list.
+
+    Only plain http(s) URLs count as results; anything else a provider emits
+    (``javascript:`` links, relative paths) is dropped first.
+
+    A provider whose requests fail ``settings.search_breaker_threshold``
+    times in a row is skipped for ``settings.search_breaker_cooldown``
+    seconds, so a dead backend stops costing a timeout on every search.  If
+    every provider's breaker is open they are all tried anyway.
+
+    When ``settings.search_chain_concurrent`` is set every provider starts at
+    once, so a search costs the slowest provider consulted rather than the sum
+    of them all; earlier providers still win over later ones.
+
+    *client*, if given, is the connection pool shared by the HTTP providers;
+    the chain owns it and closes it in :meth:`close`.
+    """
 
-    def __init__(self, providers: list[SearchProvider]) -> None:
+    def __init__(
+        self,
+        providers: list[SearchProvider],
+        client: httpx.Client | None = None,
+    ) -> None:
         self._providers = providers
+        self._client = client
+        self._breakers = [
+            _Breaker(settings.search_breaker_threshold, settings.search_breaker_cooldown)
+            for _ in providers
+        ]
+        self._in_flight = _InFlight()  # concurrent-mode calls still running
 
     def search(self, query: str, max_results: int = 5) -> list[str]:
-        for provider in self._providers:
-            urls = provider.search(query, max_results=max_results)
+        if query.strip().strip('"').strip().lower() in _EMPTY_QUERIES:
+            print(f"[search chain] skipping empty query {query!r}.")
+            return []
+        active = [
+            (provider, breaker)
+            for provider, breaker in zip(self._providers, self._breakers)
+            if not breaker.is_open()
+        ]
+        if not active:
+            # Every breaker is open: trying them beats returning nothing.
+            active = list(zip(self._providers, self._breakers))
+        if settings.search_chain_concurrent and len(active) > 1:
+            return self._search_concurrent(active, query, max_results)
+        for provider, breaker in active:
+            urls = _http_urls(_consult(provider, breaker, query, max_results))
             if urls:
                 return urls
         print("[search chain] all providers returned no results.")
         return []
 
+    def _search_concurrent(
+        self,
+        active: list[tuple[SearchProvider, _Breaker]],
+        query: str,
+        max_results: int,
+    ) -> list[str]:
+        pool = ThreadPoolExecutor(max_workers=len(active))
+        try:
+            # Each task reports to its breaker itself, so a provider still
+            # running after this search returns is recorded all the same.
+            futures = [
+                pool.submit(_consult, provider, breaker, query, max_results)
+                for provider, breaker in active
+            ]
+            for future in futures:
+                self._in_flight.track(future)
+            # Wait on each provider in priority order; later ones keep running
+            # meanwhile, so their results are usually ready when needed.
+            for future in futures:
+                urls = _http_urls(future.result())
+                if urls:
+                    return urls
+        finally:
+            # Don't wait on slower providers once a result is in hand.
+            pool.shutdown(wait=False, cancel_futures=True)
+        print("[search chain] all providers returned no results.")
+        return []
+
+    def close(self) -> None:
+        """Close every provider's client, including the shared one."""
+        self._in_flight.wait()
+        for provider in self._providers:
+            if isinstance(provider, _HTTPSearchProvider):
+                provider.close()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
 
 # ---------------------------------------------------------------------------
 # Default chain factory
@@ -273,10 +648,13 @@ def build_default_chain() -> SearchProviderChain:
 
     Brave leads because it is the fastest and most reliable.  SearXNG is tried
     next with a short per-instance timeout.  DuckDuckGo is the last resort.
+    The HTTP providers share one keep-alive client, so connections survive
+    across providers and successive searches.
     """
+    shared = _new_client()
     providers: list[SearchProvider] = []
     if settings.brave_api_key:
-        providers.append(BraveSearchProvider())
-    providers.append(SearXNGProvider())
+        providers.append(BraveSearchProvider(client=shared))
+    providers.append(SearXNGProvider(client=shared))
     providers.append(DuckDuckGoProvider())
-    return SearchProviderChain(providers)
+    return SearchProviderChain(providers, client=shared)
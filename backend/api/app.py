@@ -14,6 +14,7 @@ All endpoint groups are mounted under their respective path prefix:
     /search    — FTS / vector / hybrid search
     /ingest    — URL and PDF ingestion
     /research  — Autonomous research agent (SSE streaming)
+    /metrics   — Per-stage ingestion timings
 """
 
 from __future__ import annotations
@@ -29,6 +30,7 @@ from backend.api.routers import nodes as nodes_router
 from backend.api.routers import search as search_router
 from backend.api.routers import ingest as ingest_router
 from backend.api.routers import agent as agent_router
+from backend.api.routers import metrics as metrics_router
 
 
 @asynccontextmanager
@@ -60,6 +62,7 @@ def create_app() -> FastAPI:
     app.include_router(search_router.router, prefix="/search", tags=["search"])
     app.include_router(ingest_router.router, prefix="/ingest", tags=["ingest"])
     app.include_router(agent_router.router, prefix="/research", tags=["research"])
+    app.include_router(metrics_router.router, prefix="/metrics", tags=["metrics"])
 
     return app
 
@@ -0,0 +1,20 @@
+"""Pipeline timing endpoint.
+
+Routes
+------
+GET /metrics    Per-stage call counts and total seconds since startup
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from backend.observability import stage_totals
+
+router = APIRouter()
+
+
+@router.get("")
+def metrics() -> dict[str, dict[str, float]]:
+    """Return ``{stage: {"count": n, "seconds": total}}`` for the ingest stages."""
+    return stage_totals()
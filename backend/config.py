@@ -18,6 +18,12 @@ _env_path = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(_env_path, override=False)
 
 
+def _default_embed_batch_size() -> str:
+    """Larger Ollama embed batches when a CUDA GPU is visible, modest otherwise."""
+    cuda = os.environ.get("CUDA_VISIBLE_DEVICES", "")
+    return "128" if cuda and cuda != "-1" else "32"
+
+
 @dataclass
 class Settings:
     # ------------------------------------------------------------------
@@ -59,6 +65,21 @@ class Settings:
     embedding_dim: int = field(
         default_factory=lambda: int(os.environ.get("EMBEDDING_DIM", "768"))
     )
+    # "float32" or "int8" (quantised, cosine distance) — see backend/db/vectors.py.
+    embedding_storage: str = field(
+        default_factory=lambda: os.environ.get("EMBEDDING_STORAGE", "float32")
+    )
+    # Max texts per Ollama /api/embed request; halved on 5xx / timeout.
+    ollama_embed_batch_size: int = field(
+        default_factory=lambda: int(
+            os.environ.get("OLLAMA_EMBED_BATCH_SIZE", _default_embed_batch_size())
+        )
+    )
+    # Max texts per OpenAI embeddings request (the API allows 2048 inputs and
+    # 300k tokens per request).
+    openai_embed_batch_size: int = field(
+        default_factory=lambda: int(os.environ.get("OPENAI_EMBED_BATCH_SIZE", "256"))
+    )
 
     # ------------------------------------------------------------------
     # Chat / reasoning model
@@ -98,12 +119,32 @@ class Settings:
     searxng_instance_timeout: float = field(
         default_factory=lambda: float(os.environ.get("SEARXNG_INSTANCE_TIMEOUT", "5.0"))
     )
+    # Seconds a SearXNG instance may stay silent before the next one is tried alongside.
+    searxng_hedge_delay: float = field(
+        default_factory=lambda: float(os.environ.get("SEARXNG_HEDGE_DELAY", "1.5"))
+    )
     search_retry_max: int = field(
         default_factory=lambda: int(os.environ.get("SEARCH_RETRY_MAX", "3"))
     )
     search_retry_base_delay: float = field(
         default_factory=lambda: float(os.environ.get("SEARCH_RETRY_BASE_DELAY", "2.0"))
     )
+    search_retry_max_delay: float = field(
+        default_factory=lambda: float(os.environ.get("SEARCH_RETRY_MAX_DELAY", "30.0"))
+    )
+    # Skip a chain provider for ``cooldown`` seconds after ``threshold``
+    # consecutive provider errors (``SearchFailed``).
+    search_breaker_threshold: int = field(
+        default_factory=lambda: int(os.environ.get("SEARCH_BREAKER_THRESHOLD", "3"))
+    )
+    search_breaker_cooldown: float = field(
+        default_factory=lambda: float(os.environ.get("SEARCH_BREAKER_COOLDOWN", "60.0"))
+    )
+    # Query every chain provider at once instead of one after another.
+    search_chain_concurrent: bool = field(
+        default_factory=lambda: os.environ.get("SEARCH_CHAIN_CONCURRENT", "0").lower()
+        in ("1", "true", "yes")
+    )
 
     # ------------------------------------------------------------------
     # RAG chunking
@@ -26,6 +26,8 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     1. Load the ``sqlite-vec`` extension (vector search).
     2. Enable ``PRAGMA foreign_keys = ON``.
     3. Switch to WAL journal mode for concurrent readers.
+    4. Tune for WAL: ``synchronous = NORMAL`` (fsync only at checkpoints),
+       in-memory temp tables, a 64 MB page cache and memory-mapped reads.
 
     Args:
         db_path: Override the DB path.  Defaults to ``settings.db_path``.
@@ -40,7 +42,9 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     if str(path) != ":memory:":
         settings.ensure_workspace()
 
-    conn = sqlite3.connect(str(path), check_same_thread=False)
+    # Larger prepared-statement cache (default 128) so the FTS / vec / edge
+    # statements reused by ingestion loops are not evicted and re-parsed.
+    conn = sqlite3.connect(str(path), check_same_thread=False, cached_statements=512)
     conn.row_factory = sqlite3.Row
 
     # Load sqlite-vec extension.
@@ -53,5 +57,9 @@ def get_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     # PRAGMAs
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -64000")  # negative = KiB
+    conn.execute("PRAGMA mmap_size = 2147483648")  # 2 GiB
 
     return conn
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sqlite3
 from time import time
+from typing import Optional
 
 from backend.db.models import Edge, GraphPayload, Node
 from backend.db.nodes import _row_to_node
@@ -34,15 +35,39 @@ def connect_nodes(
         )
 
 
-def get_edges(conn: sqlite3.Connection, node_id: str) -> list[Edge]:
-    """Return all edges where *node_id* is the source **or** the target."""
+def get_edges(
+    conn: sqlite3.Connection,
+    node_id: str,
+    relation_type: Optional[str] = None,
+    target_id: Optional[str] = None,
+) -> list[Edge]:
+    """Return all edges where *node_id* is the source **or** the target.
+
+    Args:
+        conn: Open DB connection.
+        node_id: The node whose incident edges are wanted.
+        relation_type: If given, only edges with this relation are returned.
+        target_id: If given, only edges pointing at this node are returned.
+
+    The optional filters are applied in SQL so callers looking for one
+    specific edge do not have to scan every incident edge in Python.
+    """
+    where = "(source_id = ? OR target_id = ?)"
+    params: list[str] = [node_id, node_id]
+    if relation_type is not None:
+        where += " AND relation_type = ?"
+        params.append(relation_type)
+    if target_id is not None:
+        where += " AND target_id = ?"
+        params.append(target_id)
+
     rows = conn.execute(
-        """
+        f"""
         SELECT source_id, target_id, relation_type, created_at
         FROM   edges
-        WHERE  source_id = ? OR target_id = ?
-        """,
-        (node_id, node_id),
+        WHERE  {where}
+        """,  # noqa: S608
+        params,
     ).fetchall()
     return [
         Edge(
@@ -9,6 +9,7 @@ from __future__ import annotations
 import sqlite3
 
 from backend.config import settings
+from backend.db.vectors import vec_column
 
 
 # ---------------------------------------------------------------------------
@@ -16,10 +17,13 @@ from backend.config import settings
 # ---------------------------------------------------------------------------
 
 def _read_schema() -> str:
-    """Load schema.sql and inject runtime values (e.g. embedding dimension)."""
+    """Load schema.sql and inject runtime values (embedding dimension and type)."""
     schema_path = settings.schema_path
     template = schema_path.read_text(encoding="utf-8")
-    return template.replace("{embedding_dim}", str(settings.embedding_dim))
+    return (
+        template.replace("{embedding_column}", vec_column())
+        .replace("{embedding_dim}", str(settings.embedding_dim))
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
 import uuid
+from contextlib import nullcontext
 from time import time
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+import orjson
 
 from backend.db.models import Node
 
@@ -15,18 +17,47 @@ from backend.db.models import Node
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _dump_metadata(metadata: dict[str, Any]) -> str:
+    # OPT_NON_STR_KEYS keeps stdlib json's behaviour of stringifying int keys.
+    return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def _row_to_node(row: sqlite3.Row) -> Node:
     return Node(
         id=row["id"],
         node_type=row["node_type"],
         title=row["title"],
         content_path=row["content_path"],
-        metadata=json.loads(row["metadata"] or "{}"),
+        metadata=orjson.loads(row["metadata"] or "{}"),
         created_at=row["created_at"],
         updated_at=row["updated_at"],
     )
 
 
+def _insert_node(
+    conn: sqlite3.Connection,
+    title: str,
+    node_type: str,
+    metadata: Optional[dict[str, Any]] = None,
+    content_path: Optional[str] = None,
+    node_id: Optional[str] = None,
+) -> str:
+    """Execute the node INSERT and return the new ID.
+
+    Does not commit; run it inside the caller's ``with conn:`` block.
+    """
+    nid = node_id or str(uuid.uuid4())
+    now = int(time())
+    conn.execute(
+        """
+        INSERT INTO nodes (id, node_type, title, content_path, metadata, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (nid, node_type, title, content_path, _dump_metadata(metadata or {}), now, now),
+    )
+    return nid
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -53,20 +84,44 @@ def create_node(
     Returns:
         The newly created :class:`~backend.db.models.Node`.
     """
-    nid = node_id or str(uuid.uuid4())
+    with conn:
+        nid = _insert_node(conn, title, node_type, metadata, content_path, node_id)
+
+    return get_node(conn, nid)  # type: ignore[return-value]
+
+
+def bulk_create_nodes(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple[str, str, str]],
+) -> list[str]:
+    """Insert many nodes with a single ``executemany`` in one transaction.
+
+    Unlike :func:`create_node` this does not read the rows back, so it is
+    the cheaper choice when only the IDs are needed.  When *conn* is already
+    inside a transaction the rows join it and the caller commits; otherwise
+    the insert commits on its own.
+
+    Args:
+        conn: Open DB connection.
+        rows: ``(node_id, title, node_type)`` triples.  Metadata defaults to
+            ``{}`` and ``content_path`` to ``NULL``.
+
+    Returns:
+        The inserted node IDs, in input order.
+    """
     now = int(time())
-    meta_json = json.dumps(metadata or {})
+    params = [(nid, node_type, title, now, now) for nid, title, node_type in rows]
 
-    with conn:
-        conn.execute(
+    with nullcontext() if conn.in_transaction else conn:
+        conn.executemany(
             """
             INSERT INTO nodes (id, node_type, title, content_path, metadata, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, NULL, '{}', ?, ?)
             """,
-            (nid, node_type, title, content_path, meta_json, now, now),
+            params,
         )
 
-    return get_node(conn, nid)  # type: ignore[return-value]
+    return [p[0] for p in params]
 
 
 def get_node(conn: sqlite3.Connection, node_id: str) -> Optional[Node]:
@@ -96,7 +151,7 @@ def update_node(conn: sqlite3.Connection, node_id: str, **kwargs: Any) -> Node:
         if key not in allowed:
             raise ValueError(f"Cannot update field {key!r}")
         if key == "metadata":
-            updates["metadata"] = json.dumps(value)
+            updates["metadata"] = _dump_metadata(value)
         else:
             updates[key] = value
 
@@ -7,13 +7,12 @@ Project root node within N hops (default 2) are considered 'in' the project.
 
 from __future__ import annotations
 
-import json
 import sqlite3
+from time import time
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
 
 from backend.db.edges import connect_nodes, get_edges
-from backend.db.nodes import create_node, get_node, list_nodes
+from backend.db.nodes import _insert_node, _row_to_node, create_node, get_node, list_nodes
 from backend.db.models import Node, Edge
 
 
@@ -33,81 +32,62 @@ def link_to_project(conn, project_id: str, node_id: str, relation: str = "HAS_SO
     connect_nodes(conn, project_id, node_id, relation)
 
 
+def create_linked_node(
+    conn: sqlite3.Connection,
+    project_id: str,
+    title: str,
+    node_type: str,
+    relation: str = "HAS_SOURCE",
+    metadata: Optional[Dict[str, Any]] = None,
+    content_path: Optional[str] = None,
+) -> Node:
+    """Create a node and link it to a project in a single transaction.
+
+    Equivalent to :func:`~backend.db.nodes.create_node` followed by
+    :func:`link_to_project`, but with one commit instead of two.  The FTS
+    row is still added by the ``nodes_ai`` trigger.
+    """
+    with conn:
+        node_id = _insert_node(conn, title, node_type, metadata, content_path)
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO edges (source_id, target_id, relation_type, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (project_id, node_id, relation, int(time())),
+        )
+
+    return get_node(conn, node_id)  # type: ignore[return-value]
+
+
 def get_project_nodes(conn, project_id: str, depth: int = 2) -> List[Node]:
     """Fetch all nodes belonging to a project via graph traversal.
-    
-    Uses a recursive Common Table Expression (CTE) to find reachable nodes.
-    """
-    query = """
-    WITH RECURSIVE reachable(id, depth) AS (
-        SELECT ?, 0
-        UNION ALL
-        SELECT e.target_id, r.depth + 1
-        FROM edges e 
-        JOIN reachable r ON e.source_id = r.id
-        WHERE r.depth < ?
-    )
-    SELECT DISTINCT n.* 
-    FROM nodes n 
-    JOIN reachable r ON n.id = r.id
-    WHERE n.id != ?  -- Exclude the project root itself if desired, but usually we want content
+
+    The whole walk is a single recursive CTE.  ``UNION`` (not ``UNION ALL``)
+    drops repeated ``(id, depth)`` rows, so cycles cost at most one row per
+    node per level instead of multiplying paths; the depth bound ends the
+    recursion.  The outgoing-edge lookups use ``idx_edges_source``.
+
+    The project root itself is excluded, even if a cycle leads back to it.
     """
-    # Note: We might want to include the project root or not. 
-    # Let's include it if depth=0, but the query above excludes it explicitly?
-    # Actually, the recursive anchor 'SELECT ?, 0' puts the project_id in reachable.
-    # If we want the project node itself, remove the 'WHERE n.id != ?'.
-    # Usually for a "list of items in project", we exclude the container.
-    # Let's stick to returning *content* nodes. So excluding root is good.
-    
-    cursor = conn.execute(query, (project_id, depth, project_id))
-    rows = cursor.fetchall()
-    
-    nodes = []
-    for row in rows:
-        # row is a tuple, but we don't know the exact order of columns in "SELECT *"
-        # unless we check the table schema order.
-        # Nodes table schema: id, node_type, title, content_path, metadata, created_at, updated_at
-        
-        # However, to be safe and robust, let's use the same row_factory logic or map by name if cursor has description.
-        # sqlite3.Row factory is usually set on the connection.
-        
-        if isinstance(row, sqlite3.Row):
-            # If the connection has row_factory=sqlite3.Row
-             nodes.append(Node(
-                id=row["id"],
-                node_type=row["node_type"],
-                title=row["title"],
-                content_path=row["content_path"],
-                metadata=json.loads(row["metadata"] or "{}"),
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-            ))
-        else:
-            # Fallback for raw tuples (id, node_type, title, content_path, metadata, created_at, updated_at)
-            # Based on CREATE TABLE order:
-            # 0: id
-            # 1: node_type
-            # 2: title
-            # 3: content_path
-            # 4: metadata
-            # 5: created_at
-            # 6: updated_at
-            
-            # The previous code assumed row[1]=title and row[2]=node_type.
-            # But CREATE TABLE has node_type BEFORE title.
-            # That explains why "T1" (type) was showing up as title in the failed test.
-            
-            nodes.append(Node(
-                id=row[0],
-                node_type=row[1],
-                title=row[2],
-                content_path=row[3],
-                metadata=json.loads(row[4] or "{}"),
-                created_at=row[5],
-                updated_at=row[6]
-            ))
-            
-    return nodes
+    rows = conn.execute(
+        """
+        WITH RECURSIVE walk(id, depth) AS (
+            SELECT ?, 0
+            UNION
+            SELECT e.target_id, w.depth + 1
+            FROM edges e
+            JOIN walk w ON e.source_id = w.id
+            WHERE w.depth < ?
+        )
+        SELECT n.*
+        FROM nodes n
+        WHERE n.id IN (SELECT id FROM walk)
+          AND n.id != ?
+        """,
+        (project_id, depth, project_id),
+    ).fetchall()
+    return [_row_to_node(row) for row in rows]
 
 
 def get_project_summary(conn, project_id: str) -> Dict[str, Any]:
@@ -1,11 +1,12 @@
 -- =============================================================================
 -- Re:Search — Universal Node / Edge schema
 -- All CREATE statements use IF NOT EXISTS so this file is safe to re-run.
--- The literal placeholder  {embedding_dim}  is replaced at runtime by
--- backend/db/migrations.py before the SQL is executed.
+-- The literal placeholders  {embedding_dim}  and  {embedding_column}  are
+-- replaced at runtime by backend/db/migrations.py before the SQL is executed.
 -- =============================================================================
 
-PRAGMA foreign_keys = ON;
+-- PRAGMA foreign_keys is per-connection, not stored in the file; it is set by
+-- backend/db/connection.py:get_connection() on every connection it opens.
 
 -- ---------------------------------------------------------------------------
 -- Core tables
@@ -21,6 +22,8 @@ CREATE TABLE IF NOT EXISTS nodes (
     updated_at   INTEGER DEFAULT (unixepoch())
 );
 
+-- WITHOUT ROWID: rows live directly in the primary-key B-tree, so there is
+-- no separate rowid table + PK index pair to update on every insert.
 CREATE TABLE IF NOT EXISTS edges (
     source_id     TEXT NOT NULL,
     target_id     TEXT NOT NULL,
@@ -29,11 +32,16 @@ CREATE TABLE IF NOT EXISTS edges (
     PRIMARY KEY (source_id, target_id, relation_type),
     FOREIGN KEY (source_id) REFERENCES nodes(id) ON DELETE CASCADE,
     FOREIGN KEY (target_id) REFERENCES nodes(id) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 -- Graph traversal indexes
 CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id);
 CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id);
+-- Filtered lookups: get_edges(node_id, relation_type=..., target_id=...)
+CREATE INDEX IF NOT EXISTS idx_edges_src_rel_tgt ON edges(source_id, relation_type, target_id);
+
+-- list_nodes(node_type=...): filter and ORDER BY created_at from one index
+CREATE INDEX IF NOT EXISTS idx_nodes_type_created ON nodes(node_type, created_at);
 
 -- ---------------------------------------------------------------------------
 -- Full-text search (FTS5 + porter stemmer)
@@ -72,9 +80,20 @@ END;
 -- ---------------------------------------------------------------------------
 -- Vector search (sqlite-vec)
 -- Dimension is injected at runtime: {embedding_dim}
+-- Element type (float32 or int8) follows settings.embedding_storage.
 -- ---------------------------------------------------------------------------
 
 CREATE VIRTUAL TABLE IF NOT EXISTS nodes_vec USING vec0(
     id        TEXT PRIMARY KEY,
-    embedding float[{embedding_dim}]
+    embedding {embedding_column}
 );
+
+-- Content hash (embedding model + chunk text) → a Chunk node holding that
+-- text's embedding in nodes_vec; lets re-ingested chunks skip the embed call.
+CREATE TABLE IF NOT EXISTS chunk_hashes (
+    content_hash TEXT PRIMARY KEY,
+    node_id      TEXT NOT NULL,
+    FOREIGN KEY (node_id) REFERENCES nodes(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_chunk_hashes_node ON chunk_hashes(node_id);
@@ -18,10 +18,9 @@ from __future__ import annotations
 import sqlite3
 from typing import Optional
 
-import sqlite_vec
-
 from backend.db.models import Node
 from backend.db.nodes import _row_to_node
+from backend.db.vectors import serialize_embedding, vec_param
 
 
 # ---------------------------------------------------------------------------
@@ -112,7 +111,7 @@ def vector_search(
     However, sqlite-vec `vec0` table is virtual.
     Efficient pre-filtering is hard. Post-filtering is easier.
     """
-    blob = sqlite_vec.serialize_float32(embedding)
+    blob = serialize_embedding(embedding)
     
     # Strategy: Fetch top_k * 5 candidates, filter in Python if scope_ids is set.
     # Why? Passing IN clause to virtual table query might not be optimized or supported for pre-filtering.
@@ -140,7 +139,7 @@ def vector_search(
         SELECT n.*, v.distance
         FROM   nodes_vec v
         JOIN   nodes n ON n.id = v.id
-        WHERE  v.embedding MATCH ?
+        WHERE  v.embedding MATCH {vec_param()}
           AND  k = ?
           {scope_clause}
         ORDER  BY v.distance
@@ -0,0 +1,61 @@
+"""Embedding storage format for ``nodes_vec``.
+
+``settings.embedding_storage`` selects how vectors are stored:
+
+``float32`` (default)
+    Full-precision vectors compared by L2 distance.
+
+``int8``
+    Each vector is scaled by ``127 / max(|x|)`` and rounded to int8 — a
+    quarter of the size, so KNN scans read a quarter of the bytes.  Scaling
+    per vector only preserves direction, so the column is declared with
+    ``distance_metric=cosine``.  A zero vector has no direction (its cosine
+    distance is NaN) and is rejected.
+
+The format is fixed when ``nodes_vec`` is created; switching it requires a
+fresh library database.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+import sqlite_vec
+
+from backend.config import settings
+
+
+def _int8_storage() -> bool:
+    return settings.embedding_storage == "int8"
+
+
+def vec_column() -> str:
+    """Return the ``nodes_vec.embedding`` column declaration for schema.sql."""
+    if _int8_storage():
+        return f"int8[{settings.embedding_dim}] distance_metric=cosine"
+    return f"float[{settings.embedding_dim}]"
+
+
+def vec_param() -> str:
+    """Return the SQL placeholder for an embedding blob bound as a parameter.
+
+    int8 blobs must be tagged with ``vec_int8()`` so sqlite-vec does not read
+    them as float32.
+    """
+    return "vec_int8(?)" if _int8_storage() else "?"
+
+
+def serialize_embedding(embedding: Sequence[float]) -> bytes:
+    """Serialise *embedding* in the configured storage format.
+
+    Raises:
+        ValueError: If int8 storage is configured and *embedding* is all zeros.
+    """
+    if not _int8_storage():
+        return bytes(sqlite_vec.serialize_float32(list(embedding)))
+    peak = max((abs(x) for x in embedding), default=0.0)
+    if not peak:
+        raise ValueError("zero vector has no cosine distance; cannot store it as int8")
+    scale = 127.0 / peak
+    return array("b", [round(x * scale) for x in embedding]).tobytes()
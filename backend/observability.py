@@ -0,0 +1,64 @@
+"""Per-stage wall-clock timings for the ingestion pipeline.
+
+Each stage (``fetch``, ``extract``, ``chunk``, ``embed``, ``persist``)
+accumulates a call count and total time in process memory.  Wrap a stage
+function with :func:`staged` or a block with :func:`stage`; read the totals
+with :func:`stage_totals` (served at ``GET /metrics``).
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# stage -> [call count, total nanoseconds]; stages run on scraper threads too.
+_totals: dict[str, list[int]] = {}
+_lock = threading.Lock()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as one call of stage *name*."""
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter_ns() - start
+        with _lock:
+            entry = _totals.setdefault(name, [0, 0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+
+def staged(name: str) -> Callable[[F], F]:
+    """Decorator form of :func:`stage`."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def stage_totals() -> dict[str, dict[str, float]]:
+    """Return ``{stage: {"count": n, "seconds": total}}`` for every timed stage."""
+    with _lock:
+        return {
+            name: {"count": count, "seconds": total_ns / 1e9}
+            for name, (count, total_ns) in _totals.items()
+        }
+
+
+def reset_stages() -> None:
+    """Clear all accumulated timings."""
+    with _lock:
+        _totals.clear()
@@ -1,8 +1,16 @@
 """RAG ingestion pipeline package."""
 
 from backend.rag.chunker import chunk_text
-from backend.rag.embedder import embed_text
-from backend.rag.ingestor import ingest_url
-from backend.rag.pdf_ingestor import ingest_pdf
+from backend.rag.embedder import embed_text, embed_texts
+from backend.rag.ingestor import ingest_url, ingest_urls
+from backend.rag.pdf_ingestor import ingest_pdf, ingest_pdfs
 
-__all__ = ["chunk_text", "embed_text", "ingest_url", "ingest_pdf"]
+__all__ = [
+    "chunk_text",
+    "embed_text",
+    "embed_texts",
+    "ingest_url",
+    "ingest_urls",
+    "ingest_pdf",
+    "ingest_pdfs",
+]
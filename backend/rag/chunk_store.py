@@ -0,0 +1,102 @@
+"""Bulk persistence of a document's chunks, shared by the ingestors.
+
+One call writes every Chunk node, its FTS content, its embedding, its
+embedding-cache entry and its ``has_chunk`` edge with one ``executemany``
+per table inside a single transaction.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from time import time
+from typing import Any, Optional
+
+import orjson
+
+from backend.db.vectors import vec_param
+
+
+def store_chunks(
+    conn: sqlite3.Connection,
+    source_id: str,
+    title: str,
+    chunks: list[str],
+    embedded: list[tuple[str, bytes]],
+    metadata: Optional[dict[str, Any]] = None,
+) -> list[str]:
+    """Persist *chunks* of the Source node *source_id* in one transaction.
+
+    Args:
+        conn: Open, initialised DB connection (sqlite-vec loaded).
+        source_id: ID of the Source node the chunks belong to.
+        title: Document title; chunk ``i`` is titled ``"{title} [chunk i/n]"``.
+        chunks: Chunk texts, in document order.
+        embedded: ``(content_hash, embedding_blob)`` per chunk, as returned by
+            :func:`~backend.rag.embed_cache.embed_chunks`.
+        metadata: Extra keys merged into every chunk's metadata.
+
+    Returns:
+        The new Chunk node IDs, in chunk order.
+    """
+    if not chunks:
+        return []
+
+    now = int(time())
+    total = len(chunks)
+    ids = [str(uuid.uuid4()) for _ in chunks]
+    titles = [f"{title} [chunk {i + 1}/{total}]" for i in range(total)]
+    extra = metadata or {}
+
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO nodes (id, node_type, title, content_path, metadata, created_at, updated_at)
+            VALUES (?, 'Chunk', ?, NULL, ?, ?, ?)
+            """,
+            [
+                (
+                    cid,
+                    chunk_title,
+                    orjson.dumps(
+                        {"source_id": source_id, "chunk_index": i, "text": chunk, **extra}
+                    ).decode(),
+                    now,
+                    now,
+                )
+                for i, (cid, chunk_title, chunk) in enumerate(zip(ids, titles, chunks))
+            ],
+        )
+
+        # The nodes_ai trigger inserted blank FTS rows.  ``id`` is UNINDEXED,
+        # so each per-row UPDATE would scan the whole FTS table; replace the
+        # rows with one scan instead.
+        conn.execute(
+            "DELETE FROM nodes_fts WHERE id IN (SELECT value FROM json_each(?))",
+            (orjson.dumps(ids).decode(),),
+        )
+        conn.executemany(
+            "INSERT INTO nodes_fts(id, title, content_body) VALUES (?, ?, ?)",
+            zip(ids, titles, chunks),
+        )
+
+        # INSERT OR REPLACE handles re-ingestion cleanly.  The first node to
+        # carry a text becomes its embedding-cache entry.
+        conn.executemany(
+            f"INSERT OR REPLACE INTO nodes_vec(id, embedding) VALUES (?, {vec_param()})",
+            [(cid, blob) for cid, (_, blob) in zip(ids, embedded)],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO chunk_hashes(content_hash, node_id) VALUES (?, ?)",
+            [(content_hash, cid) for cid, (content_hash, _) in zip(ids, embedded)],
+        )
+
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO edges (source_id, target_id, relation_type, created_at)
+            VALUES (?, ?, 'has_chunk', ?)
+            """,
+            [(source_id, cid, now) for cid in ids],
+        )
+
+    return ids
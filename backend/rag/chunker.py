@@ -4,10 +4,18 @@ Strategy: recursive character splitting on ``\\n\\n`` → ``\\n`` → ``" "``,
 then merge small pieces into overlapping chunks of at most *chunk_size*
 characters.  The overlap seeds each new chunk with the tail of the previous
 one to preserve context across boundaries.
+
+The overlap is either fixed (*overlap*) or derived from the text length
+with the seamless-packing rule (*r_max*), which spends only the slack left
+over after covering the text with full-size chunks.
 """
 
 from __future__ import annotations
 
+import math
+
+from backend.observability import staged
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -45,14 +53,32 @@ def _recursive_split(text: str, separators: list[str], chunk_size: int) -> list[
     ]
 
 
+def _packing_overlap(length: int, chunk_size: int, r_max: float) -> int:
+    """Return the seamless-packing overlap for a text of *length* characters.
+
+    With ``n = ceil(length / chunk_size)``, covering the text with ``n + 1``
+    full chunks leaves ``(n + 1) * chunk_size - length`` characters to share
+    across the ``n`` boundaries.  That per-boundary overlap is used when it is
+    at most ``r_max * chunk_size``; otherwise chunks do not overlap.
+    """
+    n = math.ceil(length / chunk_size)
+    if n <= 1:
+        return 0
+    overlap = math.ceil(((n + 1) * chunk_size - length) / n)
+    return overlap if overlap <= r_max * chunk_size else 0
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+@staged("chunk")
 def chunk_text(
     text: str,
     chunk_size: int = 512,
     overlap: int = 64,
+    *,
+    r_max: float | None = None,
 ) -> list[str]:
     """Split *text* into overlapping, size-bounded chunks.
 
@@ -60,7 +86,11 @@ def chunk_text(
         text: The raw text to chunk.
         chunk_size: Maximum number of **characters** per chunk.
         overlap: How many characters from the end of the previous chunk to
-            prepend to the next one (preserves sentence context).
+            prepend to the next one (preserves sentence context).  Ignored
+            when *r_max* is given.
+        r_max: Maximum overlap as a fraction of *chunk_size*.  When set, the
+            overlap is derived from the text length instead (see
+            :func:`_packing_overlap`), so long texts repeat far less.
 
     Returns:
         A list of non-empty string chunks.  Returns ``[]`` for blank input.
@@ -76,14 +106,18 @@ def chunk_text(
     if not text.strip():
         return []
 
-    pieces = _recursive_split(text.strip(), ["\n\n", "\n", " "], chunk_size)
+    text = text.strip()
+    if r_max is not None:
+        overlap = _packing_overlap(len(text), chunk_size, r_max)
+
+    pieces = _recursive_split(text, ["\n\n", "\n", " "], chunk_size)
 
     chunks: list[str] = []
     buf: list[str] = []
+    buf_len = 0  # len(" ".join(buf)), kept up to date instead of re-joining
 
     for piece in pieces:
-        tentative = " ".join(buf + [piece]) if buf else piece
-        if len(tentative) > chunk_size and buf:
+        if buf and buf_len + 1 + len(piece) > chunk_size:
             # Emit the current buffer.
             chunk = " ".join(buf)
             chunks.append(chunk)
@@ -98,7 +132,9 @@ def chunk_text(
                 overlap_text = chunk
 
             buf = [overlap_text] if overlap_text.strip() else []
+            buf_len = len(overlap_text) if buf else 0
 
+        buf_len += len(piece) + 1 if buf else len(piece)
         buf.append(piece)
 
     if buf:
@@ -0,0 +1,73 @@
+"""Content-addressed reuse of chunk embeddings across ingests.
+
+Every stored chunk records a hash of its text in ``chunk_hashes``, pointing
+at the Chunk node whose ``nodes_vec`` row holds the embedding.  When the same
+text is ingested again — a re-scraped URL, a mirrored page, a re-uploaded
+PDF — the stored vector is copied instead of calling the embedding API.
+
+The hash covers the embedding provider and model as well as the text, so
+switching models never reuses vectors from the old one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from typing import Callable
+
+import orjson
+
+from backend.config import settings
+from backend.db.vectors import serialize_embedding
+
+
+def _embedding_model() -> str:
+    """Return ``provider:model`` for the active embedding configuration."""
+    if settings.embedding_provider == "openai":
+        return f"openai:{settings.openai_embed_model}"
+    return f"ollama:{settings.ollama_embed_model}"
+
+
+def chunk_hash(text: str) -> str:
+    """Return the content hash under which *text*'s embedding is cached."""
+    return hashlib.sha1(f"{_embedding_model()}\0{text}".encode()).hexdigest()
+
+
+def embed_chunks(
+    conn: sqlite3.Connection,
+    chunks: list[str],
+    embed: Callable[[list[str]], list[list[float]]],
+) -> list[tuple[str, bytes]]:
+    """Return ``(content_hash, embedding_blob)`` per chunk, embedding only new text.
+
+    Args:
+        conn: Open, initialised DB connection (sqlite-vec loaded).
+        chunks: Chunk texts, in document order.
+        embed: Batch embedder for the chunks not already stored — the
+            ingestors pass :func:`~backend.rag.embedder.embed_texts`.
+
+    Returns:
+        One ``(content_hash, blob)`` pair per entry of *chunks*, where *blob*
+        is the embedding serialised for ``nodes_vec`` (see
+        :mod:`backend.db.vectors`).
+    """
+    hashes = [chunk_hash(chunk) for chunk in chunks]
+    blobs: dict[str, bytes] = dict(
+        conn.execute(
+            """
+            SELECT h.content_hash, v.embedding
+            FROM chunk_hashes h
+            JOIN nodes_vec v ON v.id = h.node_id
+            WHERE h.content_hash IN (SELECT value FROM json_each(?))
+            """,
+            (orjson.dumps(hashes).decode(),),
+        ).fetchall()
+    )
+
+    # Embed each unseen text once, even if it repeats within *chunks*.
+    missing = {h: chunk for h, chunk in zip(hashes, chunks) if h not in blobs}
+    if missing:
+        for h, embedding in zip(missing, embed(list(missing.values()))):
+            blobs[h] = serialize_embedding(embedding)
+
+    return [(h, blobs[h]) for h in hashes]
@@ -3,7 +3,8 @@
 Embedding providers
 -------------------
 ``ollama`` (default)
-    Calls the local Ollama REST API at ``/api/embeddings``.
+    Calls the local Ollama REST API: ``/api/embeddings`` for a single text,
+    the batch endpoint ``/api/embed`` for :func:`embed_texts`.
     Configure via ``OLLAMA_BASE_URL`` and ``OLLAMA_EMBED_MODEL``.
 
 ``openai``
@@ -19,6 +20,33 @@ from __future__ import annotations
 import httpx
 
 from backend.config import settings
+from backend.observability import staged
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+
+# Module-level singleton — one pooled client per process, so ingesting many
+# chunks reuses keep-alive connections instead of a TCP handshake per call.
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        try:
+            import h2  # noqa: F401, PLC0415
+
+            http2 = True
+        except ImportError:  # httpx[http2] extra not installed
+            http2 = False
+        _client = httpx.Client(
+            http2=http2,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
 
 
 # ---------------------------------------------------------------------------
@@ -27,17 +55,36 @@ from backend.config import settings
 
 def _embed_ollama(text: str) -> list[float]:
     """Call Ollama ``/api/embeddings`` and return the embedding vector."""
-    with httpx.Client(timeout=60.0) as client:
-        response = client.post(
-            f"{settings.ollama_base_url}/api/embeddings",
-            json={"model": settings.ollama_embed_model, "prompt": text},
-        )
-        response.raise_for_status()
-        return response.json()["embedding"]
+    response = _get_client().post(
+        f"{settings.ollama_base_url}/api/embeddings",
+        json={"model": settings.ollama_embed_model, "prompt": text},
+    )
+    response.raise_for_status()
+    return response.json()["embedding"]
 
 
-def _embed_openai(text: str) -> list[float]:
-    """Call the OpenAI embeddings API and return the embedding vector."""
+def _embed_ollama_batch(texts: list[str]) -> list[list[float]]:
+    """Call Ollama ``/api/embed`` once for all *texts*.
+
+    Older Ollama servers have no batch endpoint (404) or answer without its
+    ``embeddings`` key; either way fall back to one ``/api/embeddings`` call
+    per text.
+    """
+    response = _get_client().post(
+        f"{settings.ollama_base_url}/api/embed",
+        json={"model": settings.ollama_embed_model, "input": texts},
+    )
+    if response.status_code == 404:
+        return [_embed_ollama(text) for text in texts]
+    response.raise_for_status()
+    embeddings: list[list[float]] | None = response.json().get("embeddings")
+    if embeddings is None:
+        return [_embed_ollama(text) for text in texts]
+    return embeddings
+
+
+def _openai_api_key() -> str:
+    """Return ``OPENAI_API_KEY`` or raise if it is not set."""
     import os
 
     api_key = os.environ.get("OPENAI_API_KEY", "")
@@ -46,15 +93,73 @@ def _embed_openai(text: str) -> list[float]:
             "OPENAI_API_KEY environment variable is not set. "
             "Set it or switch to EMBEDDING_PROVIDER=ollama."
         )
+    return api_key
 
-    with httpx.Client(timeout=60.0) as client:
-        response = client.post(
-            "https://api.openai.com/v1/embeddings",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"model": settings.openai_embed_model, "input": text},
-        )
-        response.raise_for_status()
-        return response.json()["data"][0]["embedding"]
+
+def _embed_ollama_batched(texts: list[str]) -> list[list[float]]:
+    """Embed *texts* in client-side batches of ``settings.ollama_embed_batch_size``.
+
+    A 5xx response or a timeout usually means the batch was too large for
+    the server, so the same slice is retried at half the size, down to a
+    single text before the error is re-raised.
+    """
+    batch = max(1, settings.ollama_embed_batch_size)
+    embeddings: list[list[float]] = []
+    start = 0
+    while start < len(texts):
+        part = texts[start:start + batch]
+        try:
+            embeddings.extend(_embed_ollama_batch(part))
+        except (httpx.HTTPStatusError, httpx.TimeoutException) as exc:
+            client_error = (
+                isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code < 500
+            )
+            if client_error or batch == 1:
+                raise
+            batch = max(1, batch // 2)
+            continue
+        start += len(part)
+    return embeddings
+
+
+def _embed_openai(text: str) -> list[float]:
+    """Call the OpenAI embeddings API and return the embedding vector."""
+    api_key = _openai_api_key()
+
+    response = _get_client().post(
+        "https://api.openai.com/v1/embeddings",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"model": settings.openai_embed_model, "input": text},
+    )
+    response.raise_for_status()
+    return response.json()["data"][0]["embedding"]
+
+
+def _embed_openai_batch(texts: list[str]) -> list[list[float]]:
+    """Call the OpenAI embeddings API once for all *texts* (input order kept)."""
+    api_key = _openai_api_key()
+
+    response = _get_client().post(
+        "https://api.openai.com/v1/embeddings",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"model": settings.openai_embed_model, "input": texts},
+    )
+    response.raise_for_status()
+    data = response.json()["data"]
+    return [item["embedding"] for item in sorted(data, key=lambda item: item["index"])]
+
+
+def _embed_openai_batched(texts: list[str]) -> list[list[float]]:
+    """Embed *texts* in requests of at most ``settings.openai_embed_batch_size``.
+
+    OpenAI caps the inputs (and tokens) per request, and the batch ingestors
+    hand over every chunk of many documents at once.
+    """
+    batch = max(1, settings.openai_embed_batch_size)
+    embeddings: list[list[float]] = []
+    for start in range(0, len(texts), batch):
+        embeddings.extend(_embed_openai_batch(texts[start:start + batch]))
+    return embeddings
 
 
 # ---------------------------------------------------------------------------
@@ -82,3 +187,30 @@ def embed_text(text: str) -> list[float]:
     if settings.embedding_provider == "openai":
         return _embed_openai(text)
     return _embed_ollama(text)
+
+
+@staged("embed")
+def embed_texts(texts: list[str]) -> list[list[float]]:
+    """Return one embedding vector per entry of *texts*, in input order.
+
+    Uses batch requests to the active provider instead of one request per
+    text, which is what the ingestors need for a document's chunks.  Requests
+    carry at most ``settings.ollama_embed_batch_size`` (Ollama) or
+    ``settings.openai_embed_batch_size`` (OpenAI) texts each.
+
+    Args:
+        texts: The input strings (typically the chunks of one document).
+
+    Returns:
+        A list of embedding vectors, ``len(texts)`` long.
+
+    Raises:
+        httpx.HTTPStatusError: If the embedding API returns a non-2xx status.
+        EnvironmentError: If ``OPENAI_API_KEY`` is missing when using the
+            OpenAI provider.
+    """
+    if not texts:
+        return []
+    if settings.embedding_provider == "openai":
+        return _embed_openai_batched(texts)
+    return _embed_ollama_batched(texts)
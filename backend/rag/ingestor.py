@@ -3,57 +3,51 @@
 ``ingest_url`` orchestrates the full pipeline from a raw URL to a populated
 knowledge base:
 
-    fetch → extract → create Source node → chunk → embed → store chunks
+    fetch → extract → chunk → embed → store Source node and chunks
+
+``ingest_urls`` runs the same pipeline for several URLs, fetching them
+concurrently and embedding all of their chunks in one batch.
 """
 
 from __future__ import annotations
 
 import sqlite3
-
-import sqlite_vec
+from concurrent.futures import ThreadPoolExecutor
 
 from backend.config import settings
-from backend.db.edges import connect_nodes
 from backend.db.models import Node
 from backend.db.nodes import create_node
+from backend.observability import staged
+from backend.rag.chunk_store import store_chunks
 from backend.rag.chunker import chunk_text
-from backend.rag.embedder import embed_text
+from backend.rag.embed_cache import embed_chunks
+from backend.rag.embedder import embed_texts
 from backend.scraper.extractor import extract_content
 from backend.scraper.fetcher import fetch_url
+from backend.scraper.models import CleanPage
 
 
-def ingest_url(conn: sqlite3.Connection, url: str) -> Node:
-    """Scrape *url*, chunk its text, embed each chunk, and persist everything.
+# ---------------------------------------------------------------------------
+# Pipeline stages
+# ---------------------------------------------------------------------------
 
-    Pipeline:
-        1. :func:`~backend.scraper.fetcher.fetch_url` — HTTP fetch (Playwright
-           fallback for SPAs).
-        2. :func:`~backend.scraper.extractor.extract_content` — readability
-           extraction.
-        3. Create a ``Source`` node in the DB.
-        4. Update the FTS row for the source node with the full extracted text.
-        5. :func:`~backend.rag.chunker.chunk_text` — split into overlapping
-           character chunks.
-        6. :func:`~backend.rag.embedder.embed_text` — embed each chunk.
-        7. Create a ``Chunk`` node per chunk, persist its FTS content, and
-           insert its embedding into ``nodes_vec``.
-        8. Create a ``has_chunk`` edge from the Source to each Chunk node.
+def _fetch_and_chunk(url: str) -> tuple[CleanPage, list[str]]:
+    """Fetch, extract and chunk *url* — the network-bound half of the pipeline."""
+    clean = extract_content(fetch_url(url))
+    return clean, chunk_text(clean.text, settings.chunk_size, settings.chunk_overlap)
 
-    Args:
-        conn: Open, initialised DB connection (sqlite-vec loaded).
-        url: The web page URL to ingest.
-
-    Returns:
-        The newly created ``Source`` :class:`~backend.db.models.Node`.
-    """
-    # ------------------------------------------------------------------
-    # 1 & 2 — Fetch and extract
-    # ------------------------------------------------------------------
-    raw = fetch_url(url)
-    clean = extract_content(raw)
 
+@staged("persist")
+def _store_document(
+    conn: sqlite3.Connection,
+    url: str,
+    clean: CleanPage,
+    chunks: list[str],
+    embedded: list[tuple[str, bytes]],
+) -> Node:
+    """Persist the Source node, its chunks, their embeddings and edges."""
     # ------------------------------------------------------------------
-    # 3 — Create the Source node
+    # Create the Source node
     # ------------------------------------------------------------------
     source_node = create_node(
         conn,
@@ -67,7 +61,7 @@ def ingest_url(conn: sqlite3.Connection, url: str) -> Node:
     )
 
     # ------------------------------------------------------------------
-    # 4 — Update FTS with the full extracted text
+    # Update FTS with the full extracted text
     # The nodes_ai trigger already inserted a blank row; we UPDATE it.
     # ------------------------------------------------------------------
     with conn:
@@ -77,45 +71,81 @@ def ingest_url(conn: sqlite3.Connection, url: str) -> Node:
         )
 
     # ------------------------------------------------------------------
-    # 5 — Chunk
+    # Store every chunk with its embedding in one transaction
     # ------------------------------------------------------------------
-    chunks = chunk_text(clean.text, settings.chunk_size, settings.chunk_overlap)
+    store_chunks(conn, source_node.id, clean.title or url, chunks, embedded)
 
-    # ------------------------------------------------------------------
-    # 6 & 7 — Embed each chunk and store in DB
-    # ------------------------------------------------------------------
-    total = len(chunks)
-    for i, chunk in enumerate(chunks):
-        embedding = embed_text(chunk)
-
-        # Create a Chunk node; its text is stored in metadata for retrieval.
-        chunk_node = create_node(
-            conn,
-            title=f"{clean.title or url} [chunk {i + 1}/{total}]",
-            node_type="Chunk",
-            metadata={
-                "source_id": source_node.id,
-                "chunk_index": i,
-                "text": chunk,
-            },
-        )
+    return source_node
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
 
-        # Persist chunk text in FTS so keyword search finds individual chunks.
-        with conn:
-            conn.execute(
-                "UPDATE nodes_fts SET content_body = ? WHERE id = ?",
-                (chunk, chunk_node.id),
-            )
+def ingest_url(conn: sqlite3.Connection, url: str) -> Node:
+    """Scrape *url*, chunk its text, embed each chunk, and persist everything.
 
-        # Upsert embedding — INSERT OR REPLACE handles re-ingestion cleanly.
-        blob = sqlite_vec.serialize_float32(embedding)
-        with conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO nodes_vec(id, embedding) VALUES (?, ?)",
-                (chunk_node.id, blob),
-            )
+    Pipeline:
+        1. :func:`~backend.scraper.fetcher.fetch_url` — HTTP fetch (Playwright
+           fallback for SPAs).
+        2. :func:`~backend.scraper.extractor.extract_content` — readability
+           extraction.
+        3. :func:`~backend.rag.chunker.chunk_text` — split into overlapping
+           character chunks.
+        4. :func:`~backend.rag.embedder.embed_texts` — embed all chunks in one
+           batch request, skipping chunks whose text is already stored (see
+           :mod:`backend.rag.embed_cache`).
+        5. Create a ``Source`` node in the DB and update its FTS row with the
+           full extracted text.
+        6. Create a ``Chunk`` node per chunk, persist its FTS content, insert
+           its embedding into ``nodes_vec`` and add a ``has_chunk`` edge from
+           the Source — all in one transaction
+           (:func:`~backend.rag.chunk_store.store_chunks`).
 
-        # 8 — Edge: source → chunk
-        connect_nodes(conn, source_node.id, chunk_node.id, relation_type="has_chunk")
+    Args:
+        conn: Open, initialised DB connection (sqlite-vec loaded).
+        url: The web page URL to ingest.
 
-    return source_node
+    Returns:
+        The newly created ``Source`` :class:`~backend.db.models.Node`.
+    """
+    clean, chunks = _fetch_and_chunk(url)
+    embedded = embed_chunks(conn, chunks, embed_texts)  # one batch request per document
+    return _store_document(conn, url, clean, chunks, embedded)
+
+
+def ingest_urls(conn: sqlite3.Connection, urls: list[str]) -> list[Node]:
+    """Ingest several URLs, overlapping their fetches.
+
+    Fetch, extraction and chunking run on up to ``settings.scrape_concurrency``
+    worker threads.  The chunks of every document then go to a single
+    :func:`~backend.rag.embedder.embed_texts` call, and all DB writes happen
+    on the calling thread, since SQLite allows one writer at a time.
+
+    Args:
+        conn: Open, initialised DB connection (sqlite-vec loaded).
+        urls: The web page URLs to ingest.
+
+    Returns:
+        One ``Source`` :class:`~backend.db.models.Node` per URL, in input order.
+
+    Raises:
+        Exception: The first fetch or extraction error, before anything is
+            written to the DB.
+    """
+    if not urls:
+        return []
+
+    workers = max(1, min(settings.scrape_concurrency, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pages = list(pool.map(_fetch_and_chunk, urls))
+
+    embedded = embed_chunks(conn, [chunk for _, chunks in pages for chunk in chunks], embed_texts)
+
+    nodes: list[Node] = []
+    offset = 0
+    for url, (clean, chunks) in zip(urls, pages):
+        doc_embedded = embedded[offset:offset + len(chunks)]
+        offset += len(chunks)
+        nodes.append(_store_document(conn, url, clean, chunks, doc_embedded))
+    return nodes
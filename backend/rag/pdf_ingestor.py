@@ -2,22 +2,25 @@
 
 ``ingest_pdf`` accepts a local PDF path and follows the same chunk → embed →
 store pipeline as :mod:`backend.rag.ingestor`, replacing the web-fetch step
-with ``pypdf`` text extraction.
+with ``pypdf`` text extraction.  ``ingest_pdfs`` does the same for several
+files, extracting them in worker processes and embedding in one batch.
 """
 
 from __future__ import annotations
 
+import os
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import sqlite_vec
-
 from backend.config import settings
-from backend.db.edges import connect_nodes
 from backend.db.models import Node
 from backend.db.nodes import create_node
+from backend.observability import stage, staged
+from backend.rag.chunk_store import store_chunks
 from backend.rag.chunker import chunk_text
-from backend.rag.embedder import embed_text
+from backend.rag.embed_cache import embed_chunks
+from backend.rag.embedder import embed_texts
 
 
 def _extract_pdf_text(path: str | Path) -> str:
@@ -43,29 +46,15 @@ def _extract_pdf_text(path: str | Path) -> str:
     return "\n\n".join(pages)
 
 
-def ingest_pdf(conn: sqlite3.Connection, path: str | Path) -> Node:
-    """Extract text from a PDF file, chunk it, embed each chunk, and persist.
-
-    Pipeline mirrors :func:`~backend.rag.ingestor.ingest_url` from step 3
-    onwards:
-
-        extract text (pypdf) → create Source node → update FTS →
-        chunk → embed → create Chunk nodes → insert embeddings → edges
-
-    Args:
-        conn: Open, initialised DB connection (sqlite-vec loaded).
-        path: Absolute or relative path to the PDF file on disk.
-
-    Returns:
-        The newly created ``Source`` :class:`~backend.db.models.Node`.
-    """
-    pdf_path = Path(path)
-
-    # ------------------------------------------------------------------
-    # Extract text from the PDF
-    # ------------------------------------------------------------------
-    full_text = _extract_pdf_text(pdf_path)
-
+@staged("persist")
+def _store_pdf(
+    conn: sqlite3.Connection,
+    pdf_path: Path,
+    full_text: str,
+    chunks: list[str],
+    embedded: list[tuple[str, bytes]],
+) -> Node:
+    """Persist the Source node for *pdf_path*, its chunks and their embeddings."""
     # ------------------------------------------------------------------
     # Create the Source node
     # ------------------------------------------------------------------
@@ -90,42 +79,73 @@ def ingest_pdf(conn: sqlite3.Connection, path: str | Path) -> Node:
         )
 
     # ------------------------------------------------------------------
-    # Chunk, embed, and store
+    # Store the chunks
     # ------------------------------------------------------------------
+    store_chunks(
+        conn, source_node.id, pdf_path.stem, chunks, embedded, metadata={"source_type": "pdf"}
+    )
+
+    return source_node
+
+
+def ingest_pdf(conn: sqlite3.Connection, path: str | Path) -> Node:
+    """Extract text from a PDF file, chunk it, embed each chunk, and persist.
+
+    Pipeline mirrors :func:`~backend.rag.ingestor.ingest_url`, replacing the
+    web fetch with ``pypdf`` extraction:
+
+        extract text (pypdf) → chunk → embed → create Source node →
+        update FTS → create Chunk nodes → insert embeddings → edges
+
+    Args:
+        conn: Open, initialised DB connection (sqlite-vec loaded).
+        path: Absolute or relative path to the PDF file on disk.
+
+    Returns:
+        The newly created ``Source`` :class:`~backend.db.models.Node`.
+    """
+    pdf_path = Path(path)
+    with stage("extract"):
+        full_text = _extract_pdf_text(pdf_path)
     chunks = chunk_text(full_text, settings.chunk_size, settings.chunk_overlap)
+    embedded = embed_chunks(conn, chunks, embed_texts)  # one batch request per document
+    return _store_pdf(conn, pdf_path, full_text, chunks, embedded)
 
-    total = len(chunks)
-    for i, chunk in enumerate(chunks):
-        embedding = embed_text(chunk)
-
-        chunk_node = create_node(
-            conn,
-            title=f"{pdf_path.stem} [chunk {i + 1}/{total}]",
-            node_type="Chunk",
-            metadata={
-                "source_id": source_node.id,
-                "chunk_index": i,
-                "text": chunk,
-                "source_type": "pdf",
-            },
-        )
 
-        # Persist chunk text in FTS.
-        with conn:
-            conn.execute(
-                "UPDATE nodes_fts SET content_body = ? WHERE id = ?",
-                (chunk, chunk_node.id),
-            )
+def ingest_pdfs(conn: sqlite3.Connection, paths: list[str | Path]) -> list[Node]:
+    """Ingest several PDF files, extracting their text in parallel.
 
-        # Upsert embedding into nodes_vec.
-        blob = sqlite_vec.serialize_float32(embedding)
-        with conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO nodes_vec(id, embedding) VALUES (?, ?)",
-                (chunk_node.id, blob),
-            )
+    ``pypdf`` is pure Python, so extraction runs in a
+    ``ProcessPoolExecutor`` (one worker per CPU, at most one per file) to
+    get past the GIL.  The chunks of every file then go to a single
+    :func:`~backend.rag.embedder.embed_texts` call, and all DB writes happen
+    in the calling process.
 
-        # Edge: source → chunk
-        connect_nodes(conn, source_node.id, chunk_node.id, relation_type="has_chunk")
+    Args:
+        conn: Open, initialised DB connection (sqlite-vec loaded).
+        paths: Absolute or relative paths to the PDF files on disk.
 
-    return source_node
+    Returns:
+        One ``Source`` :class:`~backend.db.models.Node` per path, in input order.
+
+    Raises:
+        FileNotFoundError: If any path does not exist; nothing is written.
+    """
+    pdf_paths = [Path(path) for path in paths]
+    if not pdf_paths:
+        return []
+
+    workers = max(1, min(os.cpu_count() or 1, len(pdf_paths)))
+    with stage("extract"), ProcessPoolExecutor(max_workers=workers) as pool:
+        texts = list(pool.map(_extract_pdf_text, pdf_paths))
+
+    chunked = [chunk_text(text, settings.chunk_size, settings.chunk_overlap) for text in texts]
+    embedded = embed_chunks(conn, [chunk for chunks in chunked for chunk in chunks], embed_texts)
+
+    nodes: list[Node] = []
+    offset = 0
+    for pdf_path, full_text, chunks in zip(pdf_paths, texts, chunked):
+        doc_embedded = embedded[offset:offset + len(chunks)]
+        offset += len(chunks)
+        nodes.append(_store_pdf(conn, pdf_path, full_text, chunks, doc_embedded))
+    return nodes
@@ -7,8 +7,11 @@ from typing import List
 
 import trafilatura
 
+from backend.observability import staged
 from backend.scraper.models import CleanPage, RawPage
 
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+_LINK_RE = re.compile(r'<a[^>]+href=["\']([^"\'#][^"\']*)["\']', re.IGNORECASE)
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -16,7 +19,7 @@ from backend.scraper.models import CleanPage, RawPage
 
 def _extract_title(html: str) -> str:
     """Return the text content of the first ``<title>`` tag, or empty string."""
-    match = re.search(r"<title[^>]*>([^<]+)</title>", html, re.IGNORECASE)
+    match = _TITLE_RE.search(html)
     if match:
         return match.group(1).strip()
     return ""
@@ -27,10 +30,9 @@ def _extract_links(html: str) -> List[str]:
 
     Fragment-only links (``#anchor``) and empty hrefs are excluded.
     """
-    pattern = re.compile(r'<a[^>]+href=["\']([^"\'#][^"\']*)["\']', re.IGNORECASE)
     seen: set[str] = set()
     links: List[str] = []
-    for m in pattern.finditer(html):
+    for m in _LINK_RE.finditer(html):
         href = m.group(1).strip()
         if href and href not in seen:
             seen.add(href)
@@ -42,11 +44,12 @@ def _bs4_fallback(html: str) -> str:
     """Extract readable text using BeautifulSoup ``<main>``/``<article>`` heuristics.
 
     Imported lazily so the rest of the module can be imported without bs4 if
-    trafilatura always succeeds in tests.
+    trafilatura always succeeds in tests.  Parses with the C-backed ``lxml``
+    tree builder, which trafilatura already depends on.
     """
     from bs4 import BeautifulSoup  # noqa: PLC0415
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     # Strip non-content elements
     for tag in soup(["script", "style", "nav", "footer", "header"]):
         tag.decompose()
@@ -61,6 +64,7 @@ def _bs4_fallback(html: str) -> str:
 # Public API
 # ---------------------------------------------------------------------------
 
+@staged("extract")
 def extract_content(raw: RawPage) -> CleanPage:
     """Extract clean, readable text from *raw*.
 
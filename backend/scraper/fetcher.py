@@ -7,6 +7,7 @@ import re
 import httpx
 
 from backend.config import settings
+from backend.observability import staged
 from backend.scraper.models import RawPage
 
 # ---------------------------------------------------------------------------
@@ -18,6 +19,10 @@ _SPA_PATTERNS = [
     re.compile(r"ng-version=", re.IGNORECASE),
     re.compile(r"data-reactroot", re.IGNORECASE),
 ]
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style)[^>]*>.*?</(script|style)>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
 
 _DEFAULT_HEADERS = {
     "User-Agent": (
@@ -34,13 +39,14 @@ def _is_spa(html: str) -> bool:
         if pattern.search(html):
             return True
     # Heuristic: very little visible text relative to total HTML size.
+    # Only pages over 2000 chars qualify, so skip the tag stripping otherwise.
+    if len(html) <= 2000:
+        return False
     # Strip <script> and <style> blocks first so their source code doesn't
     # count as visible text, then strip remaining tags.
-    no_scripts = re.sub(r"<(script|style)[^>]*>.*?</(script|style)>", "", html, flags=re.IGNORECASE | re.DOTALL)
-    stripped = re.sub(r"<[^>]+>", "", no_scripts).strip()
-    if len(html) > 2000 and len(stripped) < 200:
-        return True
-    return False
+    no_scripts = _SCRIPT_STYLE_RE.sub("", html)
+    stripped = _TAG_RE.sub("", no_scripts).strip()
+    return len(stripped) < 200
 
 
 def _fetch_with_playwright(url: str) -> RawPage:
@@ -65,7 +71,8 @@ def _fetch_with_playwright(url: str) -> RawPage:
     return RawPage(url=url, html=html, status_code=200)
 
 
-def fetch_url(url: str) -> RawPage:
+@staged("fetch")
+def fetch_url(url: str, transport: httpx.BaseTransport | None = None) -> RawPage:
     """Fetch *url* and return a :class:`RawPage`.
 
     Uses ``httpx`` for standard pages.  Automatically falls back to a headless
@@ -76,6 +83,11 @@ def fetch_url(url: str) -> RawPage:
     rather than with a per-request sleep, which was the primary latency
     bottleneck when scraping multiple URLs.
 
+    Args:
+        url: The page to fetch.
+        transport: Optional httpx transport override (tests pass an
+            ``httpx.MockTransport``); defaults to the real network.
+
     Raises:
         httpx.HTTPStatusError: If the server returns a 4xx/5xx status code.
     """
@@ -83,6 +95,7 @@ def fetch_url(url: str) -> RawPage:
         headers=_DEFAULT_HEADERS,
         timeout=settings.request_timeout,
         follow_redirects=True,
+        transport=transport,
     ) as client:
         response = client.get(url)
         response.raise_for_status()
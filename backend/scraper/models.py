@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class RawPage:
     """The raw HTTP response for a single URL fetch."""
 
@@ -15,7 +15,7 @@ class RawPage:
     status_code: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CleanPage:
     """Cleaned, readable content extracted from a :class:`RawPage`."""
 
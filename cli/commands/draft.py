@@ -9,8 +9,8 @@ import shutil
 
 from backend.db import get_connection, init_db
 from backend.db.edges import connect_nodes
-from backend.db.nodes import create_node, get_node, update_node, list_nodes
-from backend.db.projects import link_to_project, get_project_nodes
+from backend.db.nodes import get_node, update_node, list_nodes
+from backend.db.projects import create_linked_node, get_project_nodes
 from backend.config import settings
 
 from cli.context import load_context, require_context
@@ -53,11 +53,11 @@ def draft_new(
     init_db(conn)
 
     try:
-        # Create Artifact Node
-        node = create_node(conn, title=title, node_type="Artifact")
-        
-        # Link to Project
-        link_to_project(conn, ctx.active_project_id, node.id, relation="HAS_ARTIFACT")
+        # Create the Artifact node and link it to the project in one transaction
+        node = create_linked_node(
+            conn, ctx.active_project_id, title=title, node_type="Artifact",
+            relation="HAS_ARTIFACT",
+        )
         
         # Initialize empty content file
         content_dir = settings.workspace_dir / "content"
@@ -6,13 +6,14 @@ Stored in `~/.research_cli/context.json`.
 
 from __future__ import annotations
 
-import json
+import os
 import sys
 from dataclasses import asdict, dataclass, field
 from functools import wraps
 from pathlib import Path
 from typing import Any, Callable
 
+import orjson
 import typer
 from backend.config import settings
 
@@ -24,14 +25,14 @@ class CliContext:
     user_preferences: dict[str, Any] = field(default_factory=dict)
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self), indent=2)
+        return orjson.dumps(asdict(self), option=orjson.OPT_INDENT_2).decode()
 
     @classmethod
     def from_json(cls, data: str) -> CliContext:
         try:
-            raw = json.loads(data)
+            raw = orjson.loads(data)
             return cls(**raw)
-        except (json.JSONDecodeError, TypeError):
+        except (orjson.JSONDecodeError, TypeError):
             return cls()
 
 
@@ -45,7 +46,7 @@ def load_context() -> CliContext:
     path = _get_context_path()
     if not path.exists():
         return CliContext()
-    
+
     try:
         return CliContext.from_json(path.read_text(encoding="utf-8"))
     except Exception:
@@ -53,9 +54,12 @@ def load_context() -> CliContext:
 
 
 def save_context(ctx: CliContext) -> None:
-    """Save the CLI context to disk."""
+    """Save the CLI context to disk (atomically, via a temp file + rename)."""
     settings.cli_config_dir.mkdir(parents=True, exist_ok=True)
-    _get_context_path().write_text(ctx.to_json(), encoding="utf-8")
+    path = _get_context_path()
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(ctx.to_json(), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def require_context(func: Callable) -> Callable:
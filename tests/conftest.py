@@ -0,0 +1,189 @@
+"""Shared pytest fixtures."""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import httpx
+import pytest
+
+from backend.config import settings
+from backend.db import get_connection, init_db, migrations
+
+# Raw context.json body; avoids the CliContext -> asdict -> json.dump path
+# that save_context() takes on every test setup.
+_CTX_TEMPLATE = (
+    '{{"active_project_id": {}, "active_project_name": {}, "user_preferences": {{}}}}'
+)
+
+
+class StubTransport(httpx.MockTransport):
+    """``httpx.MockTransport`` answering from a route table.
+
+    Routes are keyed on ``(method, url)``, with the query string ignored.  A
+    route is either an ``httpx.Response`` (copied per request, so it can be
+    served repeatedly) or a ``handler(request) -> httpx.Response`` callable,
+    which may also raise to simulate transport errors.  A request to any
+    other route fails with ``AssertionError``.  Every request is recorded
+    in ``requests``.
+    """
+
+    def __init__(self, routes: dict | None = None) -> None:
+        self.routes = dict(routes or {})
+        self.requests: list[httpx.Request] = []
+        super().__init__(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        key = (request.method, str(request.url.copy_with(query=None)))
+        assert key in self.routes, f"unexpected request: {key}"
+        route = self.routes[key]
+        if callable(route):
+            return route(request)
+        return httpx.Response(route.status_code, headers=route.headers, content=route.content)
+
+
+@pytest.fixture
+def stub_transport():
+    """Return a factory for a :class:`StubTransport` serving fixed responses."""
+    return StubTransport
+
+
+@pytest.fixture
+def mock_httpx_transport(monkeypatch):
+    """Route the embedder's and search providers' HTTP through one :class:`StubTransport`.
+
+    Tests fill ``transport.routes`` and inspect ``transport.requests``.
+    """
+    transport = StubTransport()
+    clients: list[httpx.Client] = []
+
+    def new_client() -> httpx.Client:
+        clients.append(httpx.Client(transport=transport))
+        return clients[-1]
+
+    embed_client = new_client()
+    monkeypatch.setattr("backend.rag.embedder._get_client", lambda: embed_client)
+    # Each provider that opens its own client gets a fresh one on the stub.
+    monkeypatch.setattr("backend.agent.search_providers._new_client", new_client)
+    yield transport
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the CLI command modules (and their Typer registration) up front."""
+    import cli.commands.agent  # noqa: F401, PLC0415
+    import cli.commands.draft  # noqa: F401, PLC0415
+    import cli.commands.library  # noqa: F401, PLC0415
+    import cli.commands.map  # noqa: F401, PLC0415
+    import cli.commands.project  # noqa: F401, PLC0415
+
+
+def _schema_fingerprint() -> str:
+    """Hash of everything that shapes the initialised schema."""
+    digest = hashlib.sha256()
+    for path in (settings.schema_path, Path(migrations.__file__)):
+        digest.update(path.read_bytes())
+    digest.update(f"{settings.embedding_dim}:{settings.embedding_storage}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _build_template(path: Path) -> None:
+    conn = get_connection(path)
+    try:
+        init_db(conn)
+    finally:
+        # Closing the last connection checkpoints the WAL into the main file,
+        # so a plain file copy carries the full schema.
+        conn.close()
+
+
+@pytest.fixture(scope="session")
+def _db_template(pytestconfig, tmp_path_factory):
+    """Initialised library DB for ``clean_db`` and ``memory_db`` to copy.
+
+    Kept in pytest's cache directory across runs, keyed on the schema
+    fingerprint, so ``init_db`` only runs again after schema.sql,
+    migrations.py or the embedding dimension change.
+    """
+    cache = getattr(pytestconfig, "cache", None)  # absent with -p no:cacheprovider
+    if cache is None:
+        template = tmp_path_factory.mktemp("db_template") / "library.db"
+        _build_template(template)
+        return template
+
+    template = cache.mkdir("db_template") / f"library-{_schema_fingerprint()}.db"
+    if not template.exists():
+        # Build under a per-process name, then rename into place, so
+        # concurrent xdist workers never see a half-written template.
+        building = template.with_name(f".{template.name}.{os.getpid()}.tmp")
+        _build_template(building)
+        os.replace(building, template)
+    return template
+
+
+@pytest.fixture(scope="session")
+def _memory_db_template(_db_template):
+    """Initialised in-memory DB, snapshotted into each ``memory_db`` via ``backup()``."""
+    source = get_connection(_db_template)
+    conn = get_connection(":memory:")  # type: ignore[arg-type]
+    try:
+        source.backup(conn)
+    finally:
+        source.close()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def memory_db(_memory_db_template):
+    """Fresh in-memory connection restored from the session template."""
+    conn = get_connection(":memory:")  # type: ignore[arg-type]
+    _memory_db_template.backup(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def clean_db(tmp_path, monkeypatch, _db_template):
+    """Provide a fresh DB and context directory for each test."""
+    db_path = tmp_path / "library.db"
+    shutil.copyfile(_db_template, db_path)
+
+    monkeypatch.setattr("backend.config.settings.workspace_dir", tmp_path)
+
+    cli_dir = tmp_path / ".research_cli"
+    cli_dir.mkdir()
+    monkeypatch.setattr("cli.context.settings.cli_config_dir", cli_dir)
+
+    return db_path
+
+
+@pytest.fixture
+def conn(clean_db):
+    """One connection to the ``clean_db`` file, held open for the whole test.
+
+    CLI commands still open and close their own connections; in WAL mode
+    this connection sees their committed writes on its next read.
+    """
+    connection = get_connection(clean_db)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def write_ctx(clean_db):
+    """Return a helper that writes ``context.json`` for the active project directly."""
+    cli_dir = clean_db.parent / ".research_cli"
+
+    def _write_ctx(project_id, project_name=None):
+        (cli_dir / "context.json").write_text(
+            _CTX_TEMPLATE.format(json.dumps(project_id), json.dumps(project_name)),
+            encoding="utf-8",
+        )
+
+    return _write_ctx
@@ -0,0 +1,85 @@
+"""Shared setup helpers for the test suite."""
+
+from __future__ import annotations
+
+import io
+import sqlite3
+from contextlib import contextmanager, redirect_stdout
+from time import time
+from typing import Any, Callable, Iterable, Iterator, Sequence
+from uuid import uuid4
+
+from backend.db.models import Node
+from backend.db.nodes import get_node
+
+
+@contextmanager
+def bulk(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed writes in one ``BEGIN IMMEDIATE`` ... ``COMMIT`` transaction.
+
+    Only raw ``conn.execute`` / ``executemany`` calls belong inside: the
+    ``backend.db`` helpers commit through ``with conn:``, which would end
+    the transaction early.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def call_command(command: Callable[..., Any], **kwargs: Any) -> str:
+    """Call a command callback directly (no argv parsing) and return its stdout."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        command(**kwargs)
+    return buf.getvalue()
+
+
+def make_project_with_nodes(
+    conn: sqlite3.Connection,
+    project_title: str,
+    nodes: Sequence[tuple[str, str]],
+    links: Iterable[tuple[str, str]] = (),
+) -> tuple[Node, list[Node]]:
+    """Create a project, its nodes and project links in a single transaction.
+
+    ``create_project`` / ``create_node`` / ``link_to_project`` each commit on
+    their own; this helper writes the same rows with one commit instead.
+
+    Args:
+        conn: Open DB connection with the schema initialised.
+        project_title: Title of the new ``Project`` node.
+        nodes: ``(title, node_type)`` pairs to create.
+        links: ``(node_title, relation)`` pairs linking a created node to the
+            project.
+
+    Returns:
+        The project node and the created nodes, in the order given.
+    """
+    now = int(time())
+    project_id = str(uuid4())
+    ids = {title: str(uuid4()) for title, _ in nodes}
+
+    with bulk(conn):
+        conn.executemany(
+            """
+            INSERT INTO nodes (id, node_type, title, content_path, metadata, created_at, updated_at)
+            VALUES (?, ?, ?, NULL, '{}', ?, ?)
+            """,
+            [(project_id, "Project", project_title, now, now)]
+            + [(ids[title], node_type, title, now, now) for title, node_type in nodes],
+        )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO edges (source_id, target_id, relation_type, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(project_id, ids[title], relation, now) for title, relation in links],
+        )
+
+    project = get_node(conn, project_id)
+    created = [get_node(conn, ids[title]) for title, _ in nodes]
+    return project, created  # type: ignore[return-value]
@@ -2,34 +2,18 @@
 
 from unittest.mock import patch
 
-import pytest
 from typer.testing import CliRunner
 
-from backend.db import get_connection, init_db
 from backend.db.nodes import create_node
 from backend.db.projects import create_project, link_to_project, get_project_nodes
-from cli.context import CliContext, save_context
-from cli.commands.agent import agent_app
+from cli.commands.agent import agent_app, agent_hire, agent_status
+from tests.helpers import call_command
 
-runner = CliRunner()
+runner = CliRunner(mix_stderr=False)
 
 
-@pytest.fixture
-def clean_db(tmp_path, monkeypatch):
-    """Fresh DB and context directory isolated per test."""
-    monkeypatch.setattr("backend.config.settings.workspace_dir", tmp_path)
-
-    cli_dir = tmp_path / ".research_cli"
-    cli_dir.mkdir()
-    monkeypatch.setattr("cli.context.settings.cli_config_dir", cli_dir)
-
-    return tmp_path
-
-
-def test_agent_hire(clean_db):
+def test_agent_hire(clean_db, conn, write_ctx):
     """Research runs (mocked), report and sources are linked to the active project."""
-    conn = get_connection()
-    init_db(conn)
 
     # Create a project and set it as active.
     project = create_project(conn, "Hire Test Project")
@@ -39,10 +23,8 @@ def test_agent_hire(clean_db):
                            metadata={"goal": "test goal", "iterations": 1, "sources_count": 1})
     source = create_node(conn, title="Test Source", node_type="Source",
                          metadata={"url": "https://example.com/test", "word_count": 100})
-    conn.close()
 
-    ctx = CliContext(active_project_id=project.id, active_project_name=project.title)
-    save_context(ctx)
+    write_ctx(project.id, project.title)
 
     # Fake state returned by run_research.
     fake_state = {
@@ -66,23 +48,17 @@ def test_agent_hire(clean_db):
     assert "1 source node" in result.output
 
     # Verify DB: both nodes linked to project.
-    conn = get_connection()
     project_node_ids = {n.id for n in get_project_nodes(conn, project.id, depth=2)}
-    conn.close()
 
     assert artifact.id in project_node_ids, "Artifact not linked to project"
     assert source.id in project_node_ids, "Source not linked to project"
 
 
-def test_agent_hire_no_report(clean_db):
+def test_agent_hire_no_report(clean_db, conn, write_ctx):
     """Command handles gracefully when the agent produces no report."""
-    conn = get_connection()
-    init_db(conn)
     project = create_project(conn, "No Report Project")
-    conn.close()
 
-    ctx = CliContext(active_project_id=project.id, active_project_name=project.title)
-    save_context(ctx)
+    write_ctx(project.id, project.title)
 
     fake_state = {
         "goal": "empty run",
@@ -97,16 +73,13 @@ def test_agent_hire_no_report(clean_db):
     }
 
     with patch("cli.commands.agent.run_research", return_value=fake_state):
-        result = runner.invoke(agent_app, ["hire", "--goal", "empty run"])
+        output = call_command(agent_hire, goal="empty run", depth="standard")
 
-    assert result.exit_code == 0, result.output
-    assert "no report" in result.output.lower()
+    assert "no report" in output.lower()
 
 
-def test_agent_status(clean_db):
+def test_agent_status(clean_db, conn, write_ctx):
     """Lists agent-produced artifacts in the active project."""
-    conn = get_connection()
-    init_db(conn)
 
     project = create_project(conn, "Status Test Project")
 
@@ -123,34 +96,25 @@ def test_agent_status(clean_db):
     draft = create_node(conn, title="Manual Draft", node_type="Artifact", metadata={})
     link_to_project(conn, project.id, draft.id, "HAS_ARTIFACT")
 
-    conn.close()
-
-    ctx = CliContext(active_project_id=project.id, active_project_name=project.title)
-    save_context(ctx)
+    write_ctx(project.id, project.title)
 
-    result = runner.invoke(agent_app, ["status"])
+    output = call_command(agent_status)
 
-    assert result.exit_code == 0, result.output
-    assert "Report: batteries" in result.output
-    assert "Summarise battery tech" in result.output
+    assert "Report: batteries" in output
+    assert "Summarise battery tech" in output
     # The non-agent draft must not be listed.
-    assert "Manual Draft" not in result.output
+    assert "Manual Draft" not in output
 
 
-def test_agent_status_no_reports(clean_db):
+def test_agent_status_no_reports(clean_db, conn, write_ctx):
     """Status command shows a clear message when no reports exist."""
-    conn = get_connection()
-    init_db(conn)
     project = create_project(conn, "Empty Project")
-    conn.close()
 
-    ctx = CliContext(active_project_id=project.id, active_project_name=project.title)
-    save_context(ctx)
+    write_ctx(project.id, project.title)
 
-    result = runner.invoke(agent_app, ["status"])
+    output = call_command(agent_status)
 
-    assert result.exit_code == 0, result.output
-    assert "No agent-produced reports" in result.output
+    assert "No agent-produced reports" in output
 
 
 def test_agent_hire_requires_context(clean_db):
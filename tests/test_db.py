@@ -11,6 +11,8 @@ sqlite-vec must be installed (``pip install sqlite-vec``).
 from __future__ import annotations
 
 import sqlite3
+import uuid
+from functools import lru_cache
 from typing import Generator
 
 import pytest
@@ -22,6 +24,7 @@ from backend.db.edges import connect_nodes, get_edges, get_graph_data
 from backend.db.migrations import current_version, init_db
 from backend.db.models import Node
 from backend.db.nodes import (
+    bulk_create_nodes,
     create_node,
     delete_node,
     get_node,
@@ -29,6 +32,7 @@ from backend.db.nodes import (
     update_node,
 )
 from backend.db.search import fts_search, hybrid_search, vector_search
+from tests.helpers import bulk
 
 
 # ---------------------------------------------------------------------------
@@ -36,9 +40,42 @@ from backend.db.search import fts_search, hybrid_search, vector_search
 # ---------------------------------------------------------------------------
 
 @pytest.fixture()
-def conn() -> Generator[sqlite3.Connection, None, None]:
+def conn(memory_db: sqlite3.Connection) -> sqlite3.Connection:
     """In-memory connection with sqlite-vec loaded and schema initialised."""
+    return memory_db
+
+
+@pytest.fixture(scope="module")
+def ones_blob() -> bytes:
+    """``[1.0] * embedding_dim`` serialised once for the whole module."""
+    return sqlite_vec.serialize_float32([1.0] * settings.embedding_dim)
+
+
+@lru_cache(maxsize=None)
+def _blob(value: float) -> bytes:
+    """Serialised constant embedding of ``value``, memoised per value."""
+    return sqlite_vec.serialize_float32([value] * settings.embedding_dim)
+
+
+@pytest.fixture(scope="module")
+def conn_module(
+    _memory_db_template: sqlite3.Connection,
+) -> Generator[sqlite3.Connection, None, None]:
+    """One initialised in-memory connection shared across the whole module.
+
+    Read-only tests only: nothing is rolled back between tests, so anything
+    that writes uses the per-test ``conn`` instead.
+    """
     connection = get_connection(db_path=":memory:")  # type: ignore[arg-type]
+    _memory_db_template.backup(connection)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture()
+def file_conn(tmp_path) -> Generator[sqlite3.Connection, None, None]:
+    """On-disk connection, for behaviour ``:memory:`` cannot show (WAL)."""
+    connection = get_connection(db_path=tmp_path / "t.db")
     init_db(connection)
     yield connection
     connection.close()
@@ -49,41 +86,49 @@ def conn() -> Generator[sqlite3.Connection, None, None]:
 # ---------------------------------------------------------------------------
 
 class TestConnection:
-    def test_sqlite_vec_loaded(self, conn: sqlite3.Connection) -> None:
+    def test_sqlite_vec_loaded(self, conn_module: sqlite3.Connection) -> None:
         """sqlite-vec should expose vec_version()."""
-        row = conn.execute("SELECT vec_version()").fetchone()
+        row = conn_module.execute("SELECT vec_version()").fetchone()
         assert row is not None
         assert row[0]  # non-empty string
 
-    def test_foreign_keys_enabled(self, conn: sqlite3.Connection) -> None:
-        row = conn.execute("PRAGMA foreign_keys").fetchone()
+    def test_foreign_keys_enabled(self, conn_module: sqlite3.Connection) -> None:
+        row = conn_module.execute("PRAGMA foreign_keys").fetchone()
         assert row[0] == 1
 
-    def test_wal_mode(self, conn: sqlite3.Connection) -> None:
-        row = conn.execute("PRAGMA journal_mode").fetchone()
-        # In-memory DBs always return 'memory', on-disk returns 'wal'
-        assert row[0] in ("wal", "memory")
+    def test_wal_mode(self, file_conn: sqlite3.Connection) -> None:
+        row = file_conn.execute("PRAGMA journal_mode").fetchone()
+        assert row[0] == "wal"
+
+    def test_wal_tuning_pragmas(self, file_conn: sqlite3.Connection) -> None:
+        assert file_conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert file_conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert file_conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
 
 
 class TestInitDb:
-    def test_tables_exist(self, conn: sqlite3.Connection) -> None:
+    def test_tables_exist(self, conn_module: sqlite3.Connection) -> None:
         tables = {
             r[0]
-            for r in conn.execute(
+            for r in conn_module.execute(
                 "SELECT name FROM sqlite_master WHERE type IN ('table', 'shadow')"
             ).fetchall()
         }
         assert "nodes" in tables
         assert "edges" in tables
 
-    def test_version_table_exists(self, conn: sqlite3.Connection) -> None:
-        row = conn.execute(
+    def test_edges_is_without_rowid(self, conn_module: sqlite3.Connection) -> None:
+        with pytest.raises(sqlite3.OperationalError):
+            conn_module.execute("SELECT rowid FROM edges")
+
+    def test_version_table_exists(self, conn_module: sqlite3.Connection) -> None:
+        row = conn_module.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'"
         ).fetchone()
         assert row is not None
 
-    def test_current_version_zero_on_fresh_db(self, conn: sqlite3.Connection) -> None:
-        assert current_version(conn) == 0
+    def test_current_version_zero_on_fresh_db(self, conn_module: sqlite3.Connection) -> None:
+        assert current_version(conn_module) == 0
 
     def test_init_db_is_idempotent(self, conn: sqlite3.Connection) -> None:
         # Calling init_db a second time must not raise
@@ -112,6 +157,22 @@ class TestNodesCrud:
         node = create_node(conn, title="No Meta", node_type="Concept")
         assert node.metadata == {}
 
+    def test_bulk_create_nodes(self, conn: sqlite3.Connection) -> None:
+        ids = bulk_create_nodes(conn, [("n-1", "First", "Source"), ("n-2", "Second", "Concept")])
+        assert ids == ["n-1", "n-2"]
+        second = get_node(conn, "n-2")
+        assert second is not None
+        assert second.title == "Second"
+        assert second.node_type == "Concept"
+        assert second.metadata == {}
+
+    def test_bulk_create_nodes_joins_open_transaction(self, conn: sqlite3.Connection) -> None:
+        with bulk(conn):
+            bulk_create_nodes(conn, [("n-1", "First", "Source")])
+            assert conn.in_transaction
+        assert not conn.in_transaction
+        assert get_node(conn, "n-1") is not None
+
     def test_get_node_found(self, conn: sqlite3.Connection) -> None:
         created = create_node(conn, title="Fetch Me", node_type="Artifact")
         fetched = get_node(conn, created.id)
@@ -163,6 +224,18 @@ class TestNodesCrud:
         assert all(n.node_type == "Artifact" for n in artifacts)
         assert len(artifacts) == 1
 
+    def test_list_nodes_filtered_uses_type_index(self, conn: sqlite3.Connection) -> None:
+        plan = " ".join(
+            row["detail"]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN "
+                "SELECT * FROM nodes WHERE node_type = ? ORDER BY created_at DESC",
+                ("Source",),
+            )
+        )
+        assert "idx_nodes_type_created" in plan
+        assert "TEMP B-TREE" not in plan
+
     def test_list_nodes_empty(self, conn: sqlite3.Connection) -> None:
         assert list_nodes(conn) == []
 
@@ -196,6 +269,20 @@ class TestEdges:
         edges_b = get_edges(conn, b.id)
         assert len(edges_b) == 1
 
+    def test_get_edges_filters_by_relation_and_target(self, conn: sqlite3.Connection) -> None:
+        a = create_node(conn, "A", "Concept")
+        b = create_node(conn, "B", "Concept")
+        c = create_node(conn, "C", "Concept")
+        connect_nodes(conn, a.id, b.id, "mentions")
+        connect_nodes(conn, a.id, b.id, "cites")
+        connect_nodes(conn, a.id, c.id, "mentions")
+
+        assert len(get_edges(conn, a.id, relation_type="mentions")) == 2
+        matching = get_edges(conn, a.id, relation_type="mentions", target_id=b.id)
+        assert len(matching) == 1
+        assert matching[0].target_id == b.id
+        assert matching[0].relation_type == "mentions"
+
     def test_edge_cascade_delete(self, conn: sqlite3.Connection) -> None:
         a = create_node(conn, "A", "Concept")
         b = create_node(conn, "B", "Concept")
@@ -253,16 +340,17 @@ class TestVectorSearch:
     def _make_embedding(dim: int, value: float) -> list[float]:
         return [value] * dim
 
-    def test_vector_search_returns_closest_node(self, conn: sqlite3.Connection) -> None:
+    def test_vector_search_returns_closest_node(
+        self, conn: sqlite3.Connection, ones_blob: bytes
+    ) -> None:
         dim = settings.embedding_dim
         node = create_node(conn, title="Vector Node", node_type="Source")
 
         embedding = self._make_embedding(dim, 1.0)
-        blob = sqlite_vec.serialize_float32(embedding)
         with conn:
             conn.execute(
                 "INSERT INTO nodes_vec(id, embedding) VALUES (?, ?)",
-                (node.id, blob),
+                (node.id, ones_blob),
             )
 
         results = vector_search(conn, embedding, top_k=5)
@@ -277,26 +365,60 @@ class TestVectorSearch:
 
     def test_vector_search_top_k_respected(self, conn: sqlite3.Connection) -> None:
         dim = settings.embedding_dim
-        for i in range(5):
-            n = create_node(conn, title=f"VNode{i}", node_type="Source")
-            emb = self._make_embedding(dim, float(i) * 0.1)
-            blob = sqlite_vec.serialize_float32(emb)
-            with conn:
-                conn.execute(
-                    "INSERT INTO nodes_vec(id, embedding) VALUES (?, ?)", (n.id, blob)
-                )
+        with bulk(conn):
+            ids = bulk_create_nodes(
+                conn, [(str(uuid.uuid4()), f"VNode{i}", "Source") for i in range(5)]
+            )
+            conn.executemany(
+                "INSERT INTO nodes_vec(id, embedding) VALUES (?, ?)",
+                [(nid, _blob(i * 0.1)) for i, nid in enumerate(ids)],
+            )
 
         q = self._make_embedding(dim, 0.0)
         results = vector_search(conn, q, top_k=3)
         assert len(results) <= 3
 
+    def test_int8_storage_ranks_by_cosine(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from backend.db.vectors import serialize_embedding, vec_param
+
+        monkeypatch.setattr(settings, "embedding_storage", "int8")
+        dim = settings.embedding_dim
+        int8_conn = get_connection(":memory:")  # type: ignore[arg-type]
+        try:
+            init_db(int8_conn)
+            near, far = (
+                create_node(int8_conn, title=title, node_type="Source")
+                for title in ("Near", "Far")
+            )
+            with int8_conn:
+                int8_conn.executemany(
+                    f"INSERT INTO nodes_vec(id, embedding) VALUES (?, {vec_param()})",
+                    [
+                        (near.id, serialize_embedding([0.5] * dim)),
+                        (far.id, serialize_embedding([0.5, -0.5] * (dim // 2))),
+                    ],
+                )
+            # One byte per dimension, and magnitude does not affect the ranking.
+            assert len(serialize_embedding([0.5] * dim)) == dim
+            results = vector_search(int8_conn, [3.0] * dim, top_k=2)
+        finally:
+            int8_conn.close()
+        assert [n.id for n in results] == [near.id, far.id]
+
+    def test_int8_storage_rejects_zero_vector(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from backend.db.vectors import serialize_embedding
+
+        monkeypatch.setattr(settings, "embedding_storage", "int8")
+        with pytest.raises(ValueError, match="zero vector"):
+            serialize_embedding([0.0] * settings.embedding_dim)
+
 
 # ---------------------------------------------------------------------------
 # Hybrid search
 # ---------------------------------------------------------------------------
 
 class TestHybridSearch:
-    def test_hybrid_merges_results(self, conn: sqlite3.Connection) -> None:
+    def test_hybrid_merges_results(self, conn: sqlite3.Connection, ones_blob: bytes) -> None:
         dim = settings.embedding_dim
         # Node that only appears in FTS
         fts_only = create_node(conn, title="Electrolyte Chemistry", node_type="Source")
@@ -304,11 +426,10 @@ class TestHybridSearch:
         vec_only = create_node(conn, title="Completely Unrelated Title", node_type="Source")
 
         emb = [1.0] * dim
-        blob = sqlite_vec.serialize_float32(emb)
         with conn:
             conn.execute(
                 "INSERT INTO nodes_vec(id, embedding) VALUES (?, ?)",
-                (vec_only.id, blob),
+                (vec_only.id, ones_blob),
             )
 
         results = hybrid_search(conn, "electrolyte", emb, top_k=10)
@@ -316,15 +437,14 @@ class TestHybridSearch:
         assert fts_only.id in result_ids
         assert vec_only.id in result_ids
 
-    def test_hybrid_deduplicates(self, conn: sqlite3.Connection) -> None:
+    def test_hybrid_deduplicates(self, conn: sqlite3.Connection, ones_blob: bytes) -> None:
         dim = settings.embedding_dim
         node = create_node(conn, title="Solid State Battery", node_type="Source")
         emb = [1.0] * dim
-        blob = sqlite_vec.serialize_float32(emb)
         with conn:
             conn.execute(
                 "INSERT INTO nodes_vec(id, embedding) VALUES (?, ?)",
-                (node.id, blob),
+                (node.id, ones_blob),
             )
 
         results = hybrid_search(conn, "battery", emb, top_k=10)
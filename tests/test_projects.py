@@ -1,13 +1,11 @@
 """Tests for the project management functions."""
 
-import json
 import pytest
-from uuid import uuid4
 
-from backend.db import get_connection, init_db
 from backend.db.nodes import create_node
 from backend.db.edges import connect_nodes
 from backend.db.projects import (
+    create_linked_node,
     create_project,
     list_projects,
     link_to_project,
@@ -15,14 +13,12 @@ from backend.db.projects import (
     get_project_summary,
     export_project,
 )
+from tests.helpers import make_project_with_nodes
 
 
 @pytest.fixture
-def db_conn():
-    conn = get_connection(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+def db_conn(memory_db):
+    return memory_db
 
 
 def test_create_project(db_conn):
@@ -44,13 +40,9 @@ def test_list_projects_empty(db_conn):
 def test_get_project_nodes_depth_1(db_conn):
     proj = create_project(db_conn, "Project A")
     
-    # Create some content nodes
-    n1 = create_node(db_conn, title="Source 1", node_type="Source")
-    n2 = create_node(db_conn, title="Source 2", node_type="Source")
-    
-    # Link them to the project
-    link_to_project(db_conn, proj.id, n1.id, "HAS_SOURCE")
-    link_to_project(db_conn, proj.id, n2.id, "HAS_SOURCE")
+    # Create content nodes already linked to the project
+    n1 = create_linked_node(db_conn, proj.id, "Source 1", "Source", "HAS_SOURCE")
+    n2 = create_linked_node(db_conn, proj.id, "Source 2", "Source", "HAS_SOURCE")
     
     # Check they are retrieved
     nodes = get_project_nodes(db_conn, proj.id, depth=1)
@@ -105,16 +97,18 @@ def test_get_project_nodes_no_cycle(db_conn):
 
 
 def test_get_project_summary(db_conn):
-    proj = create_project(db_conn, "Summary Test")
-    
-    # Add 2 Sources, 1 Artifact
-    for i in range(2):
-        n = create_node(db_conn, title=f"Source {i}", node_type="Source")
-        link_to_project(db_conn, proj.id, n.id, "HAS_SOURCE")
-        
-    art = create_node(db_conn, title="My Report", node_type="Artifact")
-    link_to_project(db_conn, proj.id, art.id, "HAS_ARTIFACT")
-    
+    # 2 Sources, 1 Artifact, all written in one transaction
+    proj, _ = make_project_with_nodes(
+        db_conn,
+        "Summary Test",
+        nodes=[("Source 0", "Source"), ("Source 1", "Source"), ("My Report", "Artifact")],
+        links=[
+            ("Source 0", "HAS_SOURCE"),
+            ("Source 1", "HAS_SOURCE"),
+            ("My Report", "HAS_ARTIFACT"),
+        ],
+    )
+
     summary = get_project_summary(db_conn, proj.id)
     
     assert summary["total_nodes"] == 3
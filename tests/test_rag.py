@@ -10,24 +10,24 @@ Network calls (Ollama, OpenAI, httpx) and scraper calls are mocked throughout.
 
 from __future__ import annotations
 
+import json
 import sqlite3
-from typing import Generator
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from backend.config import settings
-from backend.db.connection import get_connection
-from backend.db.migrations import init_db
 from backend.db.nodes import list_nodes
 from backend.rag.chunker import chunk_text
-from backend.rag.embedder import embed_text
-from backend.rag.ingestor import ingest_url
-from backend.rag.pdf_ingestor import ingest_pdf
+from backend.rag.embedder import embed_text, embed_texts
+from backend.rag.ingestor import ingest_url, ingest_urls
+from backend.rag.pdf_ingestor import ingest_pdf, ingest_pdfs
 from backend.scraper.models import CleanPage, RawPage
 
-# A fixed embedding vector that matches the configured dimension.
-FAKE_EMBEDDING: list[float] = [0.1] * settings.embedding_dim
+# A fixed embedding vector that matches the configured dimension.  Built once
+# as an immutable tuple so every mock hands back the same object.
+FAKE_EMBEDDING: tuple[float, ...] = (0.1,) * settings.embedding_dim
 
 
 # ---------------------------------------------------------------------------
@@ -35,12 +35,9 @@ FAKE_EMBEDDING: list[float] = [0.1] * settings.embedding_dim
 # ---------------------------------------------------------------------------
 
 @pytest.fixture()
-def conn() -> Generator[sqlite3.Connection, None, None]:
+def conn(memory_db: sqlite3.Connection) -> sqlite3.Connection:
     """In-memory connection with sqlite-vec loaded and schema initialised."""
-    connection = get_connection(db_path=":memory:")  # type: ignore[arg-type]
-    init_db(connection)
-    yield connection
-    connection.close()
+    return memory_db
 
 
 # ---------------------------------------------------------------------------
@@ -98,52 +95,141 @@ class TestChunker:
         for chunk in chunks:
             assert chunk.strip()
 
+    def test_r_max_overlap_yields_fewer_chunks(self) -> None:
+        text = ("lorem ipsum dolor sit amet " * 400)[:10_000]
+        fixed = chunk_text(text, chunk_size=200, overlap=100)
+        packed = chunk_text(text, chunk_size=200, r_max=0.1)
+        assert len(packed) < len(fixed)
+        assert all(len(chunk) <= 200 for chunk in packed)
+
 
 # ---------------------------------------------------------------------------
 # TestEmbedder
 # ---------------------------------------------------------------------------
 
 class TestEmbedder:
-    def _make_httpx_mock(self, json_response: dict) -> MagicMock:
-        """Return a mock httpx.Client class that yields *json_response*."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = json_response
-
-        mock_client = MagicMock()
-        mock_client.post.return_value = mock_response
-
-        mock_cls = MagicMock()
-        mock_cls.return_value.__enter__.return_value = mock_client
-        return mock_cls
-
-    def test_embed_text_uses_ollama_by_default(self) -> None:
-        mock_cls = self._make_httpx_mock({"embedding": FAKE_EMBEDDING})
-        with patch("backend.rag.embedder.httpx.Client", mock_cls):
-            with patch.object(settings, "embedding_provider", "ollama"):
-                result = embed_text("test text")
-        assert result == FAKE_EMBEDDING
-        call_url = mock_cls.return_value.__enter__.return_value.post.call_args.args[0]
-        assert "/api/embeddings" in call_url
-
-    def test_embed_text_passes_correct_model_and_prompt(self) -> None:
-        mock_cls = self._make_httpx_mock({"embedding": FAKE_EMBEDDING})
-        with patch("backend.rag.embedder.httpx.Client", mock_cls):
-            with patch.object(settings, "embedding_provider", "ollama"):
-                embed_text("sample")
-        payload = mock_cls.return_value.__enter__.return_value.post.call_args.kwargs["json"]
+    _OLLAMA_EMBEDDINGS = ("POST", f"{settings.ollama_base_url}/api/embeddings")
+    _OLLAMA_EMBED = ("POST", f"{settings.ollama_base_url}/api/embed")
+    _OPENAI_EMBEDDINGS = ("POST", "https://api.openai.com/v1/embeddings")
+
+    @staticmethod
+    def _batch_handler(max_batch: int | None = None):
+        """Answer ``/api/embed`` per input; 500 for batches over *max_batch*."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            texts = json.loads(request.content)["input"]
+            if max_batch is not None and len(texts) > max_batch:
+                return httpx.Response(500, text="overloaded")
+            return httpx.Response(200, json={"embeddings": [FAKE_EMBEDDING] * len(texts)})
+
+        return handler
+
+    def test_embed_text_uses_ollama_by_default(self, mock_httpx_transport) -> None:
+        mock_httpx_transport.routes[self._OLLAMA_EMBEDDINGS] = httpx.Response(
+            200, json={"embedding": FAKE_EMBEDDING}
+        )
+        with patch.object(settings, "embedding_provider", "ollama"):
+            result = embed_text("test text")
+        assert result == list(FAKE_EMBEDDING)
+        assert mock_httpx_transport.requests[0].url.path == "/api/embeddings"
+
+    def test_embed_text_passes_correct_model_and_prompt(self, mock_httpx_transport) -> None:
+        mock_httpx_transport.routes[self._OLLAMA_EMBEDDINGS] = httpx.Response(
+            200, json={"embedding": FAKE_EMBEDDING}
+        )
+        with patch.object(settings, "embedding_provider", "ollama"):
+            embed_text("sample")
+        payload = json.loads(mock_httpx_transport.requests[0].content)
         assert payload["model"] == settings.ollama_embed_model
         assert payload["prompt"] == "sample"
 
-    def test_embed_text_openai_provider(self) -> None:
-        openai_response = {"data": [{"embedding": FAKE_EMBEDDING}]}
-        mock_cls = self._make_httpx_mock(openai_response)
-        with patch("backend.rag.embedder.httpx.Client", mock_cls):
-            with patch.object(settings, "embedding_provider", "openai"):
-                with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-                    result = embed_text("hello openai")
-        assert result == FAKE_EMBEDDING
-        call_url = mock_cls.return_value.__enter__.return_value.post.call_args.args[0]
-        assert "openai.com" in call_url
+    def test_embed_text_openai_provider(self, mock_httpx_transport) -> None:
+        mock_httpx_transport.routes[self._OPENAI_EMBEDDINGS] = httpx.Response(
+            200, json={"data": [{"embedding": FAKE_EMBEDDING}]}
+        )
+        with patch.object(settings, "embedding_provider", "openai"):
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                result = embed_text("hello openai")
+        assert result == list(FAKE_EMBEDDING)
+        request = mock_httpx_transport.requests[0]
+        assert request.url.host == "api.openai.com"
+        assert request.headers["Authorization"] == "Bearer test-key"
+
+    def test_embed_texts_batches_to_api_embed(self, mock_httpx_transport) -> None:
+        texts = ["first chunk", "second chunk"]
+        mock_httpx_transport.routes[self._OLLAMA_EMBED] = self._batch_handler()
+        with patch.object(settings, "embedding_provider", "ollama"):
+            result = embed_texts(texts)
+        assert result == [list(FAKE_EMBEDDING)] * 2
+        assert len(mock_httpx_transport.requests) == 1
+        assert json.loads(mock_httpx_transport.requests[0].content)["input"] == texts
+
+    def test_embed_texts_respects_batch_size(self, mock_httpx_transport) -> None:
+        texts = [f"chunk {i}" for i in range(10)]
+        mock_httpx_transport.routes[self._OLLAMA_EMBED] = self._batch_handler()
+        with patch.object(settings, "embedding_provider", "ollama"):
+            with patch.object(settings, "ollama_embed_batch_size", 4):
+                result = embed_texts(texts)
+        assert len(result) == 10
+        sizes = [len(json.loads(r.content)["input"]) for r in mock_httpx_transport.requests]
+        assert sizes == [4, 4, 2]
+
+    def test_embed_texts_falls_back_when_api_embed_missing(self, mock_httpx_transport) -> None:
+        mock_httpx_transport.routes[self._OLLAMA_EMBED] = httpx.Response(404, text="not found")
+        mock_httpx_transport.routes[self._OLLAMA_EMBEDDINGS] = httpx.Response(
+            200, json={"embedding": FAKE_EMBEDDING}
+        )
+        with patch.object(settings, "embedding_provider", "ollama"):
+            result = embed_texts(["a", "b"])
+        assert result == [list(FAKE_EMBEDDING)] * 2
+        paths = [r.url.path for r in mock_httpx_transport.requests]
+        assert paths == ["/api/embed", "/api/embeddings", "/api/embeddings"]
+
+    def test_embed_texts_openai_respects_batch_size(self, mock_httpx_transport) -> None:
+        def handler(request):
+            inputs = json.loads(request.content)["input"]
+            data = [{"index": i, "embedding": FAKE_EMBEDDING} for i in range(len(inputs))]
+            return httpx.Response(200, json={"data": data})
+
+        mock_httpx_transport.routes[self._OPENAI_EMBEDDINGS] = handler
+        with patch.object(settings, "embedding_provider", "openai"), \
+             patch.object(settings, "openai_embed_batch_size", 2), \
+             patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            result = embed_texts([f"chunk {i}" for i in range(5)])
+        assert len(result) == 5
+        sizes = [len(json.loads(r.content)["input"]) for r in mock_httpx_transport.requests]
+        assert sizes == [2, 2, 1]
+
+    def test_embed_texts_halves_batch_on_server_error(self, mock_httpx_transport) -> None:
+        texts = [f"chunk {i}" for i in range(4)]
+        mock_httpx_transport.routes[self._OLLAMA_EMBED] = self._batch_handler(max_batch=2)
+        with patch.object(settings, "embedding_provider", "ollama"):
+            with patch.object(settings, "ollama_embed_batch_size", 4):
+                result = embed_texts(texts)
+        assert len(result) == 4
+        sizes = [len(json.loads(r.content)["input"]) for r in mock_httpx_transport.requests]
+        assert sizes == [4, 2, 2]
+
+    def test_client_is_reused_across_calls(self, stub_transport) -> None:
+        import functools
+
+        transport = stub_transport({
+            self._OLLAMA_EMBEDDINGS: httpx.Response(200, json={"embedding": FAKE_EMBEDDING}),
+        })
+        # Patch the embedder's own ``httpx`` binding, not ``httpx.Client`` itself,
+        # so no other module sees the stub.
+        mock_httpx = MagicMock(wraps=httpx)
+        mock_httpx.Client.side_effect = functools.partial(httpx.Client, transport=transport)
+        mock_cls = mock_httpx.Client
+        with patch("backend.rag.embedder.httpx", mock_httpx):
+            with patch("backend.rag.embedder._client", None):
+                with patch.object(settings, "embedding_provider", "ollama"):
+                    embed_text("first")
+                    embed_text("second")
+                from backend.rag import embedder
+                embedder._client.close()
+        assert mock_cls.call_count == 1
+        assert len(transport.requests) == 2
 
     def test_embed_text_openai_missing_key_raises(self) -> None:
         import os
@@ -176,6 +262,7 @@ class TestIngestUrl:
     def _run_ingest(
         self,
         conn: sqlite3.Connection,
+        monkeypatch: pytest.MonkeyPatch,
         text: str = _SAMPLE_TEXT,
         title: str = "Test Page",
     ) -> object:
@@ -183,56 +270,135 @@ class TestIngestUrl:
         raw_page = RawPage(url=_SAMPLE_URL, html=_SAMPLE_HTML, status_code=200)
         clean_page = CleanPage(url=_SAMPLE_URL, title=title, text=text,
                                links=["https://example.com/link1"])
-        with patch("backend.rag.ingestor.fetch_url", return_value=raw_page):
-            with patch("backend.rag.ingestor.extract_content", return_value=clean_page):
-                with patch("backend.rag.ingestor.embed_text", return_value=FAKE_EMBEDDING):
-                    return ingest_url(conn, _SAMPLE_URL)
-
-    def test_returns_source_node(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+        monkeypatch.setattr("backend.rag.ingestor.fetch_url", lambda url: raw_page)
+        monkeypatch.setattr("backend.rag.ingestor.extract_content", lambda raw: clean_page)
+        monkeypatch.setattr(
+            "backend.rag.ingestor.embed_texts", lambda texts: [FAKE_EMBEDDING] * len(texts)
+        )
+        return ingest_url(conn, _SAMPLE_URL)
+
+    def test_returns_source_node(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         assert node.node_type == "Source"
 
-    def test_source_node_title_from_page(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+    def test_source_node_title_from_page(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         assert node.title == "Test Page"
 
-    def test_source_node_metadata_contains_url(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+    def test_source_node_metadata_contains_url(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         assert node.metadata["url"] == _SAMPLE_URL
 
-    def test_chunk_nodes_created(self, conn: sqlite3.Connection) -> None:
-        self._run_ingest(conn)
+    def test_chunk_nodes_created(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch)
         chunk_nodes = [n for n in list_nodes(conn) if n.node_type == "Chunk"]
         assert len(chunk_nodes) >= 1
 
-    def test_chunk_embeddings_stored_in_nodes_vec(self, conn: sqlite3.Connection) -> None:
-        self._run_ingest(conn)
+    def test_chunk_embeddings_stored_in_nodes_vec(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch)
         vec_rows = conn.execute("SELECT id FROM nodes_vec").fetchall()
         assert len(vec_rows) >= 1
 
-    def test_fts_content_body_updated_for_source(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+    def test_fts_content_body_updated_for_source(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         fts_row = conn.execute(
             "SELECT content_body FROM nodes_fts WHERE id = ?", (node.id,)
         ).fetchone()
         assert fts_row is not None
         assert "extracted article text" in fts_row[0]
 
-    def test_source_to_chunk_edges_created(self, conn: sqlite3.Connection) -> None:
+    def test_staged_records_pipeline_timings(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from backend.observability import reset_stages, stage_totals
+
+        reset_stages()
+        self._run_ingest(conn, monkeypatch)
+        totals = stage_totals()
+        # fetch / extract / embed are mocked out in _run_ingest.
+        assert totals["chunk"]["count"] == 1
+        assert totals["persist"]["count"] == 1
+        assert totals["persist"]["seconds"] > 0
+
+    def test_ingest_urls_batches_embeddings(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        urls = [f"https://example.com/page-{i}" for i in range(5)]
+        monkeypatch.setattr(
+            "backend.rag.ingestor.fetch_url",
+            lambda url: RawPage(url=url, html=_SAMPLE_HTML, status_code=200),
+        )
+        monkeypatch.setattr(
+            "backend.rag.ingestor.extract_content",
+            lambda raw: CleanPage(url=raw.url, title=raw.url, text=_SAMPLE_TEXT, links=[]),
+        )
+        mock_embed = MagicMock(side_effect=lambda texts: [FAKE_EMBEDDING] * len(texts))
+        monkeypatch.setattr("backend.rag.ingestor.embed_texts", mock_embed)
+
+        nodes = ingest_urls(conn, urls)
+
+        assert mock_embed.call_count == 1
+        assert [n.metadata["url"] for n in nodes] == urls
+        chunk_nodes = [n for n in list_nodes(conn) if n.node_type == "Chunk"]
+        vec_rows = conn.execute("SELECT COUNT(*) FROM nodes_vec").fetchone()[0]
+        assert vec_rows == len(chunk_nodes)
+
+    def test_reingest_reuses_stored_embeddings(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mock_embed = MagicMock(side_effect=lambda texts: [FAKE_EMBEDDING] * len(texts))
+        self._run_ingest(conn, monkeypatch)
+        monkeypatch.setattr("backend.rag.ingestor.embed_texts", mock_embed)
+
+        ingest_url(conn, _SAMPLE_URL)
+
+        mock_embed.assert_not_called()
+        chunk_nodes = [n for n in list_nodes(conn) if n.node_type == "Chunk"]
+        vec_rows = conn.execute("SELECT COUNT(*) FROM nodes_vec").fetchone()[0]
+        assert vec_rows == len(chunk_nodes)
+
+    def test_source_to_chunk_edges_created(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         from backend.db.edges import get_edges
 
-        node = self._run_ingest(conn)
-        edges = get_edges(conn, node.id)
-        has_chunk_edges = [e for e in edges if e.relation_type == "has_chunk"]
+        node = self._run_ingest(conn, monkeypatch)
+        has_chunk_edges = get_edges(conn, node.id, relation_type="has_chunk")
         assert len(has_chunk_edges) >= 1
 
-    def test_short_text_produces_single_chunk(self, conn: sqlite3.Connection) -> None:
-        self._run_ingest(conn, text="Just a short paragraph.")
+    def test_chunk_fts_rows_hold_chunk_text(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch)
+        for chunk in (n for n in list_nodes(conn) if n.node_type == "Chunk"):
+            rows = conn.execute(
+                "SELECT title, content_body FROM nodes_fts WHERE id = ?", (chunk.id,)
+            ).fetchall()
+            assert [tuple(row) for row in rows] == [(chunk.title, chunk.metadata["text"])]
+
+    def test_short_text_produces_single_chunk(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch, text="Just a short paragraph.")
         chunk_nodes = [n for n in list_nodes(conn) if n.node_type == "Chunk"]
         assert len(chunk_nodes) == 1
 
-    def test_title_falls_back_to_url_when_blank(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn, title="")
+    def test_title_falls_back_to_url_when_blank(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch, title="")
         assert node.title == _SAMPLE_URL
 
 
@@ -247,44 +413,98 @@ class TestIngestPdf:
     def _run_ingest(
         self,
         conn: sqlite3.Connection,
+        monkeypatch: pytest.MonkeyPatch,
         text: str = _PDF_TEXT,
         stem: str = "test_paper",
     ) -> object:
         """Run ingest_pdf with all external calls mocked."""
-        with patch("backend.rag.pdf_ingestor._extract_pdf_text", return_value=text):
-            with patch("backend.rag.pdf_ingestor.embed_text", return_value=FAKE_EMBEDDING):
-                return ingest_pdf(conn, f"/fake/{stem}.pdf")
-
-    def test_returns_source_node(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+        monkeypatch.setattr("backend.rag.pdf_ingestor._extract_pdf_text", lambda path: text)
+        monkeypatch.setattr(
+            "backend.rag.pdf_ingestor.embed_texts", lambda texts: [FAKE_EMBEDDING] * len(texts)
+        )
+        return ingest_pdf(conn, f"/fake/{stem}.pdf")
+
+    def test_returns_source_node(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         assert node.node_type == "Source"
 
-    def test_source_node_title_from_filename(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn, stem="my_research_paper")
+    def test_source_node_title_from_filename(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch, stem="my_research_paper")
         assert node.title == "my_research_paper"
 
-    def test_source_metadata_marks_pdf_type(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+    def test_source_metadata_marks_pdf_type(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         assert node.metadata.get("source_type") == "pdf"
 
-    def test_chunk_nodes_created(self, conn: sqlite3.Connection) -> None:
-        self._run_ingest(conn)
+    def test_chunk_nodes_created(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch)
         chunk_nodes = [n for n in list_nodes(conn) if n.node_type == "Chunk"]
         assert len(chunk_nodes) >= 1
 
-    def test_chunk_embeddings_stored_in_nodes_vec(self, conn: sqlite3.Connection) -> None:
-        self._run_ingest(conn)
+    def test_chunk_embeddings_stored_in_nodes_vec(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch)
         vec_rows = conn.execute("SELECT id FROM nodes_vec").fetchall()
         assert len(vec_rows) >= 1
 
-    def test_fts_content_body_updated_for_source(self, conn: sqlite3.Connection) -> None:
-        node = self._run_ingest(conn)
+    def test_fts_content_body_updated_for_source(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        node = self._run_ingest(conn, monkeypatch)
         fts_row = conn.execute(
             "SELECT content_body FROM nodes_fts WHERE id = ?", (node.id,)
         ).fetchone()
         assert fts_row is not None
         assert "electrolytes" in fts_row[0]
 
+    def test_same_text_in_new_pdf_reuses_embeddings(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._run_ingest(conn, monkeypatch, stem="first_copy")
+        mock_embed = MagicMock(side_effect=lambda texts: [FAKE_EMBEDDING] * len(texts))
+        monkeypatch.setattr("backend.rag.pdf_ingestor.embed_texts", mock_embed)
+
+        second = ingest_pdf(conn, "/fake/second_copy.pdf")
+
+        mock_embed.assert_not_called()
+        chunk_ids = [
+            n.id for n in list_nodes(conn)
+            if n.node_type == "Chunk" and n.metadata["source_id"] == second.id
+        ]
+        stored = conn.execute(
+            "SELECT COUNT(*) FROM nodes_vec WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(chunk_ids),),
+        ).fetchone()[0]
+        assert chunk_ids and stored == len(chunk_ids)
+
+    def test_ingest_pdfs_batches_embeddings(
+        self, conn: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Worker processes would not see the monkeypatched extractor.
+        monkeypatch.setattr("backend.rag.pdf_ingestor.ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(
+            "backend.rag.pdf_ingestor._extract_pdf_text",
+            lambda path: f"{path.stem}: {_PDF_TEXT}",
+        )
+        mock_embed = MagicMock(side_effect=lambda texts: [FAKE_EMBEDDING] * len(texts))
+        monkeypatch.setattr("backend.rag.pdf_ingestor.embed_texts", mock_embed)
+
+        nodes = ingest_pdfs(conn, [f"/fake/paper_{i}.pdf" for i in range(3)])
+
+        assert mock_embed.call_count == 1
+        assert [n.title for n in nodes] == ["paper_0", "paper_1", "paper_2"]
+
     def test_extract_pdf_text_file_not_found(self) -> None:
         from backend.rag.pdf_ingestor import _extract_pdf_text
 
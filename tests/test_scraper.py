@@ -1,8 +1,8 @@
 """Tests for Phase 2 — web scraper (fetch + content extraction).
 
 Mocking strategy:
-- ``respx`` patches ``httpx`` at the transport layer so no real network calls
-  are made during ``fetch_url`` tests.
+- ``fetch_url`` tests pass the ``stub_transport`` fixture's
+  ``httpx.MockTransport`` so no real network calls are made.
 - ``time.sleep`` is patched to avoid real delays from ``settings.rate_limit_delay``.
 - ``trafilatura.extract`` is patched in the BS4-fallback test to simulate the
   case where trafilatura returns nothing.
@@ -15,7 +15,6 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import pytest
-import respx
 import httpx
 
 from backend.scraper.models import RawPage, CleanPage
@@ -95,54 +94,50 @@ class TestIsSpa:
 # ---------------------------------------------------------------------------
 
 class TestFetchUrl:
-    def test_successful_fetch_returns_raw_page(self) -> None:
+    def test_successful_fetch_returns_raw_page(self, stub_transport) -> None:
         """A 200 response is returned as a RawPage."""
-        with respx.mock:
-            respx.get("https://example.com/article").mock(
-                return_value=httpx.Response(200, text=_SIMPLE_HTML)
-            )
-            raw = fetch_url("https://example.com/article")
+        transport = stub_transport({
+            ("GET", "https://example.com/article"): httpx.Response(200, text=_SIMPLE_HTML),
+        })
+        raw = fetch_url("https://example.com/article", transport=transport)
 
         assert isinstance(raw, RawPage)
         assert raw.url == "https://example.com/article"
         assert raw.status_code == 200
         assert "<title>Test Page</title>" in raw.html
 
-    def test_http_error_raises(self) -> None:
+    def test_http_error_raises(self, stub_transport) -> None:
         """A 404 response raises ``httpx.HTTPStatusError``."""
-        with respx.mock:
-            respx.get("https://example.com/missing").mock(
-                return_value=httpx.Response(404, text="Not Found")
-            )
-            with pytest.raises(httpx.HTTPStatusError):
-                fetch_url("https://example.com/missing")
-
-    def test_no_rate_limit_sleep_on_fetch(self) -> None:
+        transport = stub_transport({
+            ("GET", "https://example.com/missing"): httpx.Response(404, text="Not Found"),
+        })
+        with pytest.raises(httpx.HTTPStatusError):
+            fetch_url("https://example.com/missing", transport=transport)
+
+    def test_no_rate_limit_sleep_on_fetch(self, stub_transport) -> None:
         """``fetch_url`` must NOT call ``time.sleep``; rate-limiting lives at the
         agent layer (thread-pool size) not in the fetcher."""
-        with respx.mock:
-            respx.get("https://example.com/").mock(
-                return_value=httpx.Response(200, text=_SIMPLE_HTML)
-            )
-            with patch("time.sleep") as mock_sleep:
-                fetch_url("https://example.com/")
+        transport = stub_transport({
+            ("GET", "https://example.com/"): httpx.Response(200, text=_SIMPLE_HTML),
+        })
+        with patch("time.sleep") as mock_sleep:
+            fetch_url("https://example.com/", transport=transport)
 
         mock_sleep.assert_not_called()
 
-    def test_spa_triggers_playwright_fallback(self) -> None:
+    def test_spa_triggers_playwright_fallback(self, stub_transport) -> None:
         """SPA HTML causes ``_fetch_with_playwright`` to be invoked."""
         playwright_result = RawPage(
             url="https://spa-app.example.com/",
             html=_SIMPLE_HTML,
             status_code=200,
         )
-        with respx.mock:
-            respx.get("https://spa-app.example.com/").mock(
-                return_value=httpx.Response(200, text=_SPA_HTML)
-            )
-            with patch("backend.scraper.fetcher._fetch_with_playwright",
-                       return_value=playwright_result) as mock_pw:
-                raw = fetch_url("https://spa-app.example.com/")
+        transport = stub_transport({
+            ("GET", "https://spa-app.example.com/"): httpx.Response(200, text=_SPA_HTML),
+        })
+        with patch("backend.scraper.fetcher._fetch_with_playwright",
+                   return_value=playwright_result) as mock_pw:
+            raw = fetch_url("https://spa-app.example.com/", transport=transport)
 
         mock_pw.assert_called_once_with("https://spa-app.example.com/")
         assert raw.html == _SIMPLE_HTML
@@ -1,15 +1,20 @@
 """Unit tests for backend.agent.search_providers.
 
-All network calls are mocked via ``unittest.mock``.  No real HTTP connections
-are made; the tests validate provider-level parsing, retry logic, and
-chain-level failover behaviour.
+SearXNG requests go through the ``mock_httpx_transport`` fixture's
+``httpx.MockTransport``; the other providers are mocked via ``unittest.mock``.
+No real HTTP connections are made; the tests validate provider-level parsing,
+retry logic, and chain-level failover behaviour.
 """
 
 from __future__ import annotations
 
-from types import SimpleNamespace
-from unittest.mock import MagicMock, call, patch
+import sys
+import threading
+import types
+from unittest.mock import MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 
 
@@ -22,6 +27,7 @@ def _mock_httpx_response(json_data: dict, status_code: int = 200) -> MagicMock:
     resp = MagicMock()
     resp.status_code = status_code
     resp.json.return_value = json_data
+    resp.content = orjson.dumps(json_data)
     resp.raise_for_status = MagicMock()  # no-op by default
     return resp
 
@@ -31,7 +37,16 @@ def _mock_httpx_response(json_data: dict, status_code: int = 200) -> MagicMock:
 # ===========================================================================
 
 class TestSearXNGProvider:
-    def test_parses_json_results(self):
+    @staticmethod
+    def _route_all_instances(transport, route, primary: str | None = None) -> None:
+        """Serve *route* from the configured SearXNG instance and every fallback."""
+        from backend.agent.search_providers import _SEARXNG_FALLBACK_INSTANCES
+        from backend.config import settings
+
+        for base in [primary or settings.searxng_base_url, *_SEARXNG_FALLBACK_INSTANCES]:
+            transport.routes[("GET", f"{base.rstrip('/')}/search")] = route
+
+    def test_parses_json_results(self, mock_httpx_transport):
         from backend.agent.search_providers import SearXNGProvider
 
         json_data = {
@@ -41,77 +56,58 @@ class TestSearXNGProvider:
                 {"href": "https://example.com/c"},   # alternate key
             ]
         }
-        mock_resp = _mock_httpx_response(json_data)
-
-        with patch("backend.agent.search_providers.httpx.Client") as mock_client_cls:
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.return_value = mock_resp
-            mock_client_cls.return_value = ctx
+        self._route_all_instances(mock_httpx_transport, httpx.Response(200, json=json_data))
 
-            provider = SearXNGProvider()
-            result = provider.search("test query", max_results=5)
+        result = SearXNGProvider().search("test query", max_results=5)
 
         assert "https://example.com/a" in result
         assert "https://example.com/b" in result
 
-    def test_respects_max_results(self):
+    def test_respects_max_results(self, mock_httpx_transport):
         from backend.agent.search_providers import SearXNGProvider
 
         json_data = {
             "results": [{"url": f"https://example.com/{i}"} for i in range(10)]
         }
-        mock_resp = _mock_httpx_response(json_data)
+        self._route_all_instances(mock_httpx_transport, httpx.Response(200, json=json_data))
 
-        with patch("backend.agent.search_providers.httpx.Client") as mock_client_cls:
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.return_value = mock_resp
-            mock_client_cls.return_value = ctx
-
-            provider = SearXNGProvider()
-            result = provider.search("test query", max_results=3)
+        result = SearXNGProvider().search("test query", max_results=3)
 
         assert len(result) == 3
 
-    def test_returns_empty_on_http_error(self):
-        from backend.agent.search_providers import SearXNGProvider
-        import httpx
+    def test_returns_empty_on_http_error(self, mock_httpx_transport):
+        from backend.agent.search_providers import SearXNGProvider, SearchFailed
 
-        with patch("backend.agent.search_providers.httpx.Client") as mock_client_cls:
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.side_effect = httpx.ConnectError("connection refused")
-            mock_client_cls.return_value = ctx
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
 
-            provider = SearXNGProvider()
-            result = provider.search("test query")
+        self._route_all_instances(mock_httpx_transport, refuse)
+
+        result = SearXNGProvider().search("test query")
 
         assert result == []
+        assert isinstance(result, SearchFailed)
 
-    def test_returns_empty_on_json_parse_error(self):
-        from backend.agent.search_providers import SearXNGProvider
+    def test_no_hits_is_not_a_failure(self, mock_httpx_transport):
+        from backend.agent.search_providers import SearXNGProvider, SearchFailed
 
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.side_effect = ValueError("invalid JSON")
+        self._route_all_instances(mock_httpx_transport, httpx.Response(200, json={"results": []}))
 
-        with patch("backend.agent.search_providers.httpx.Client") as mock_client_cls:
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.return_value = mock_resp
-            mock_client_cls.return_value = ctx
+        result = SearXNGProvider().search("obscure query")
 
-            provider = SearXNGProvider()
-            result = provider.search("test query")
+        assert result == []
+        assert not isinstance(result, SearchFailed)
+
+    def test_returns_empty_on_json_parse_error(self, mock_httpx_transport):
+        from backend.agent.search_providers import SearXNGProvider
+
+        self._route_all_instances(mock_httpx_transport, httpx.Response(200, text="not json"))
+
+        result = SearXNGProvider().search("test query")
 
         assert result == []
 
-    def test_deduplicates_urls(self):
+    def test_deduplicates_urls(self, mock_httpx_transport):
         from backend.agent.search_providers import SearXNGProvider
 
         json_data = {
@@ -121,19 +117,92 @@ class TestSearXNGProvider:
                 {"url": "https://unique.com"},
             ]
         }
-        mock_resp = _mock_httpx_response(json_data)
+        self._route_all_instances(mock_httpx_transport, httpx.Response(200, json=json_data))
 
-        with patch("backend.agent.search_providers.httpx.Client") as mock_client_cls:
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.return_value = mock_resp
-            mock_client_cls.return_value = ctx
+        result = SearXNGProvider().search("test", max_results=10)
+
+        assert result.count("https://dup.com") == 1
+
+    def test_sends_normalised_query(self, mock_httpx_transport):
+        from backend.agent.search_providers import SearXNGProvider
+
+        self._route_all_instances(
+            mock_httpx_transport, httpx.Response(200, json={"results": [{"url": "https://a"}]})
+        )
+
+        SearXNGProvider().search('"solid state batteries"')
+
+        params = mock_httpx_transport.requests[0].url.params
+        assert params["q"] == "solid state batteries"
+        assert params["format"] == "json"
+
+    def test_healthy_primary_is_the_only_instance_queried(self, mock_httpx_transport):
+        from backend.agent.search_providers import SearXNGProvider
+
+        self._route_all_instances(
+            mock_httpx_transport, httpx.Response(200, json={"results": [{"url": "https://a"}]})
+        )
+
+        with SearXNGProvider() as provider:
+            assert provider.search("test") == ["https://a"]
+
+        assert len(mock_httpx_transport.requests) == 1
+
+    def test_hedges_slow_primary_with_next_instance(self, mock_httpx_transport):
+        from backend.agent.search_providers import SearXNGProvider
+
+        release_primary = threading.Event()
+
+        def route(request):
+            if request.url.host == "searx.be":
+                # Still blocked when the hedge answers, so the two overlapped.
+                release_primary.wait(timeout=5)
+                return httpx.Response(200, json={"results": [{"url": "https://primary"}]})
+            return httpx.Response(200, json={"results": [{"url": f"https://{request.url.host}"}]})
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.searxng_base_url = "https://searx.be"
+            mock_settings.searxng_instance_timeout = 5.0
+            mock_settings.searxng_hedge_delay = 0.0
+            self._route_all_instances(mock_httpx_transport, route, primary="https://searx.be")
 
             provider = SearXNGProvider()
-            result = provider.search("test", max_results=10)
+            result = provider.search("test")
+            release_primary.set()
+            provider.close()  # waits for the primary to finish
+
+        assert result == ["https://search.bus-hit.me"]
+        hosts = {r.url.host for r in mock_httpx_transport.requests}
+        assert hosts == {"searx.be", "search.bus-hit.me"}
+
+    def test_fallbacks_run_at_most_two_at_a_time(self, mock_httpx_transport):
+        from backend.agent.search_providers import _SEARXNG_FALLBACK_INSTANCES, SearXNGProvider
+
+        lock = threading.Lock()
+        running = peak = 0
+
+        def refuse(request):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            try:
+                raise httpx.ConnectError("connection refused", request=request)
+            finally:
+                with lock:
+                    running -= 1
 
-        assert result.count("https://dup.com") == 1
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.searxng_base_url = "https://searx.be"
+            mock_settings.searxng_instance_timeout = 5.0
+            mock_settings.searxng_hedge_delay = 0.0
+            self._route_all_instances(mock_httpx_transport, refuse, primary="https://searx.be")
+
+            with SearXNGProvider() as provider:
+                assert provider.search("test") == []
+
+        assert len(mock_httpx_transport.requests) == len({"https://searx.be", *_SEARXNG_FALLBACK_INSTANCES})
+        assert peak <= 2
 
 
 # ===========================================================================
@@ -158,6 +227,39 @@ class TestDuckDuckGoProvider:
 
         assert result == ["https://a.com", "https://b.com"]
 
+    def test_repeat_search_served_from_cache(self):
+        from backend.agent.search_providers import DuckDuckGoProvider
+
+        fake_results = [{"href": "https://a.com"}]
+        with patch("backend.agent.search_providers.DDGS") as mock_ddgs_cls:
+            ctx = MagicMock()
+            ctx.__enter__ = MagicMock(return_value=ctx)
+            ctx.__exit__ = MagicMock(return_value=False)
+            ctx.text = MagicMock(return_value=fake_results)
+            mock_ddgs_cls.return_value = ctx
+
+            provider = DuckDuckGoProvider()
+            first = provider.search("query", max_results=5)
+            second = provider.search("query", max_results=5)
+            provider.search("query", max_results=3)  # different key → miss
+
+        assert first == second == ["https://a.com"]
+        assert mock_ddgs_cls.call_count == 2
+
+    def test_empty_results_are_not_cached(self):
+        from backend.agent.search_providers import DuckDuckGoProvider
+
+        with patch("backend.agent.search_providers.DDGS") as mock_ddgs_cls:
+            ctx = MagicMock()
+            ctx.__enter__ = MagicMock(return_value=ctx)
+            ctx.__exit__ = MagicMock(return_value=False)
+            ctx.text = MagicMock(side_effect=[[], [{"href": "https://late.com"}]])
+            mock_ddgs_cls.return_value = ctx
+
+            provider = DuckDuckGoProvider()
+            assert provider.search("query") == []
+            assert provider.search("query") == ["https://late.com"]
+
     def test_retries_on_ratelimit_then_succeeds(self):
         from backend.agent.search_providers import DuckDuckGoProvider
         from duckduckgo_search.exceptions import RatelimitException
@@ -186,16 +288,21 @@ class TestDuckDuckGoProvider:
 
         assert result == ["https://ok.com"]
         assert call_count == 2
+        # Both attempts ran on the same DDGS session.
+        mock_ddgs_cls.assert_called_once()
+        ctx.__enter__.assert_called_once()
 
     def test_returns_empty_after_exhausting_retries(self):
-        from backend.agent.search_providers import DuckDuckGoProvider
+        from backend.agent.search_providers import DuckDuckGoProvider, SearchFailed
         from duckduckgo_search.exceptions import RatelimitException
 
         with patch("backend.agent.search_providers.DDGS") as mock_ddgs_cls, \
-             patch("backend.agent.search_providers.time.sleep"), \
+             patch("backend.agent.search_providers.time.sleep") as mock_sleep, \
+             patch("backend.agent.search_providers.random.uniform", side_effect=lambda a, b: b) as mock_uniform, \
              patch("backend.agent.search_providers.settings") as mock_settings:
             mock_settings.search_retry_max = 2
-            mock_settings.search_retry_base_delay = 0.0
+            mock_settings.search_retry_base_delay = 1.0
+            mock_settings.search_retry_max_delay = 5.0
 
             ctx = MagicMock()
             ctx.__enter__ = MagicMock(return_value=ctx)
@@ -207,6 +314,34 @@ class TestDuckDuckGoProvider:
             result = provider.search("query")
 
         assert result == []
+        assert isinstance(result, SearchFailed)
+        # Decorrelated jitter: uniform(base, prev * 3), capped at the max delay.
+        assert [c.args for c in mock_uniform.call_args_list] == [(1.0, 3.0), (1.0, 9.0)]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [3.0, 5.0]
+
+    def test_honours_retry_after_hint(self):
+        from backend.agent.search_providers import DuckDuckGoProvider
+
+        fake_results = [{"href": "https://ok.com"}]
+        with patch("backend.agent.search_providers.DDGS") as mock_ddgs_cls, \
+             patch("backend.agent.search_providers.time.sleep") as mock_sleep, \
+             patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_retry_max = 2
+            mock_settings.search_retry_base_delay = 1.0
+            mock_settings.search_retry_max_delay = 30.0
+
+            ctx = MagicMock()
+            ctx.__enter__ = MagicMock(return_value=ctx)
+            ctx.__exit__ = MagicMock(return_value=False)
+            ctx.text = MagicMock(
+                side_effect=[RuntimeError("429 Ratelimit, Retry-After: 7"), fake_results]
+            )
+            mock_ddgs_cls.return_value = ctx
+
+            result = DuckDuckGoProvider().search("query")
+
+        assert result == ["https://ok.com"]
+        mock_sleep.assert_called_once_with(7.0)
 
     def test_returns_empty_on_ratelimit_in_exception_message(self):
         """Older duckduckgo_search versions surface rate-limits as generic RuntimeError."""
@@ -217,6 +352,7 @@ class TestDuckDuckGoProvider:
              patch("backend.agent.search_providers.settings") as mock_settings:
             mock_settings.search_retry_max = 1
             mock_settings.search_retry_base_delay = 0.0
+            mock_settings.search_retry_max_delay = 0.0
 
             ctx = MagicMock()
             ctx.__enter__ = MagicMock(return_value=ctx)
@@ -229,6 +365,28 @@ class TestDuckDuckGoProvider:
 
         assert result == []
 
+    @pytest.mark.parametrize("message", ["202 Ratelimit", "Rate Limit exceeded", "rate-limited"])
+    def test_retries_on_ratelimit_spellings_in_message(self, message):
+        from backend.agent.search_providers import DuckDuckGoProvider
+
+        with patch("backend.agent.search_providers.DDGS") as mock_ddgs_cls, \
+             patch("backend.agent.search_providers.time.sleep") as mock_sleep, \
+             patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_retry_max = 1
+            mock_settings.search_retry_base_delay = 0.0
+            mock_settings.search_retry_max_delay = 0.0
+
+            ctx = MagicMock()
+            ctx.__enter__ = MagicMock(return_value=ctx)
+            ctx.__exit__ = MagicMock(return_value=False)
+            ctx.text = MagicMock(side_effect=[RuntimeError(message), [{"href": "https://ok.com"}]])
+            mock_ddgs_cls.return_value = ctx
+
+            result = DuckDuckGoProvider().search("query")
+
+        assert result == ["https://ok.com"]
+        mock_sleep.assert_called_once()
+
 
 # ===========================================================================
 # BraveSearchProvider
@@ -263,11 +421,7 @@ class TestBraveSearchProvider:
             mock_settings.brave_api_key = "test-key-abc"
             mock_settings.search_provider_timeout = 10.0
 
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.return_value = mock_resp
-            mock_client_cls.return_value = ctx
+            mock_client_cls.return_value.get.return_value = mock_resp
 
             provider = BraveSearchProvider()
             result = provider.search("test query", max_results=5)
@@ -275,7 +429,7 @@ class TestBraveSearchProvider:
         assert result == ["https://brave-result.com/1", "https://brave-result.com/2"]
 
     def test_returns_empty_on_network_error(self):
-        from backend.agent.search_providers import BraveSearchProvider
+        from backend.agent.search_providers import BraveSearchProvider, SearchFailed
         import httpx
 
         with patch("backend.agent.search_providers.settings") as mock_settings, \
@@ -283,16 +437,56 @@ class TestBraveSearchProvider:
             mock_settings.brave_api_key = "test-key"
             mock_settings.search_provider_timeout = 10.0
 
-            ctx = MagicMock()
-            ctx.__enter__ = MagicMock(return_value=ctx)
-            ctx.__exit__ = MagicMock(return_value=False)
-            ctx.get.side_effect = httpx.TimeoutException("timed out")
-            mock_client_cls.return_value = ctx
+            mock_client_cls.return_value.get.side_effect = httpx.TimeoutException("timed out")
 
             provider = BraveSearchProvider()
             result = provider.search("test query")
 
         assert result == []
+        assert isinstance(result, SearchFailed)
+
+    def test_reuses_one_client_across_searches(self):
+        from backend.agent.search_providers import BraveSearchProvider
+
+        mock_resp = _mock_httpx_response({"web": {"results": [{"url": "https://b.com"}]}})
+
+        with patch("backend.agent.search_providers.settings") as mock_settings, \
+             patch("backend.agent.search_providers._new_client") as mock_client_cls:
+            mock_settings.brave_api_key = "test-key"
+            mock_settings.search_provider_timeout = 10.0
+            mock_client_cls.return_value.get.return_value = mock_resp
+
+            with BraveSearchProvider() as provider:
+                for _ in range(3):
+                    assert provider.search("test query") == ["https://b.com"]
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.return_value.get.call_count == 3
+        mock_client_cls.return_value.close.assert_called_once()
+        assert provider._client is None
+
+    def test_reuses_headers_until_api_key_changes(self):
+        from backend.agent.search_providers import BraveSearchProvider
+
+        mock_resp = _mock_httpx_response({"web": {"results": [{"url": "https://b.com"}]}})
+
+        with patch("backend.agent.search_providers.settings") as mock_settings, \
+             patch("backend.agent.search_providers._new_client") as mock_client_cls:
+            mock_settings.brave_api_key = "key-1"
+            mock_settings.search_provider_timeout = 10.0
+            get = mock_client_cls.return_value.get
+            get.return_value = mock_resp
+
+            provider = BraveSearchProvider()
+            provider.search("a")
+            provider.search("b")
+            mock_settings.brave_api_key = "key-2"
+            provider.search("c")
+
+        sent = [c.kwargs["headers"] for c in get.call_args_list]
+        assert sent[0] is sent[1]
+        assert sent[2] is provider._headers
+        assert sent[2]["X-Subscription-Token"] == "key-2"
 
 
 # ===========================================================================
@@ -360,6 +554,174 @@ class TestSearchProviderChain:
 
         assert result == []
 
+    def test_concurrent_mode_survives_a_raising_provider(self):
+        from backend.agent.search_providers import SearchProviderChain
+
+        p1 = self._make_provider("P1", [])
+        p1.search.side_effect = RuntimeError("boom")
+        p2 = self._make_provider("P2", ["https://p2.com"])
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_chain_concurrent = True
+            mock_settings.search_breaker_threshold = 1
+            mock_settings.search_breaker_cooldown = 60.0
+            chain = SearchProviderChain([p1, p2])
+            assert chain.search("query") == ["https://p2.com"]
+            chain.close()
+
+        assert chain._breakers[0].is_open()  # the exception counted as a failure
+
+    def test_concurrent_straggler_still_reports_to_breaker(self):
+        from backend.agent.search_providers import SearchFailed, SearchProviderChain
+
+        p2_started = threading.Event()
+        release = threading.Event()
+        p1 = self._make_provider("P1", [])
+        p2 = self._make_provider("P2", [])
+
+        def fast_hit(*args, **kwargs):
+            p2_started.wait(timeout=5)  # don't win before P2 is under way
+            return ["https://p1.com"]
+
+        def slow_failure(*args, **kwargs):
+            p2_started.set()
+            release.wait(timeout=5)
+            return SearchFailed()
+
+        p1.search.side_effect = fast_hit
+        p2.search.side_effect = slow_failure
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_chain_concurrent = True
+            mock_settings.search_breaker_threshold = 1
+            mock_settings.search_breaker_cooldown = 60.0
+            chain = SearchProviderChain([p1, p2])
+            assert chain.search("query") == ["https://p1.com"]  # P2 still running
+            assert not chain._breakers[1].is_open()
+            release.set()
+            chain.close()  # waits for P2 to finish
+
+        assert chain._breakers[1].is_open()
+
+    def test_open_breaker_skips_provider(self):
+        from backend.agent.search_providers import SearchFailed, SearchProviderChain
+
+        p1 = self._make_provider("P1", SearchFailed())
+        p2 = self._make_provider("P2", ["https://p2.com"])
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_chain_concurrent = False
+            mock_settings.search_breaker_threshold = 3
+            mock_settings.search_breaker_cooldown = 60.0
+            chain = SearchProviderChain([p1, p2])
+            for _ in range(4):
+                assert chain.search("query") == ["https://p2.com"]
+
+        assert p1.search.call_count == 3  # open after three failures
+        assert p2.search.call_count == 4
+
+    def test_no_hits_do_not_open_breaker(self):
+        from backend.agent.search_providers import SearchProviderChain
+
+        p1 = self._make_provider("P1", [])
+        p2 = self._make_provider("P2", [])
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_chain_concurrent = False
+            mock_settings.search_breaker_threshold = 3
+            mock_settings.search_breaker_cooldown = 60.0
+            chain = SearchProviderChain([p1, p2])
+            for _ in range(5):
+                chain.search("obscure query")
+
+        assert p1.search.call_count == 5
+        assert p2.search.call_count == 5
+
+    def test_all_breakers_open_still_tries_providers(self):
+        from backend.agent.search_providers import SearchFailed, SearchProviderChain
+
+        p1 = self._make_provider("P1", SearchFailed())
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_chain_concurrent = False
+            mock_settings.search_breaker_threshold = 1
+            mock_settings.search_breaker_cooldown = 60.0
+            chain = SearchProviderChain([p1])
+            chain.search("query")  # opens P1's breaker
+            p1.search.return_value = ["https://back.com"]
+            assert chain.search("query") == ["https://back.com"]
+
+        assert p1.search.call_count == 2
+
+    def test_breaker_probes_again_after_cooldown(self):
+        from backend.agent.search_providers import SearchFailed, SearchProviderChain
+
+        p1 = self._make_provider("P1", SearchFailed())
+        p2 = self._make_provider("P2", ["https://p2.com"])
+
+        with patch("backend.agent.search_providers.settings") as mock_settings, \
+             patch("backend.agent.search_providers.time.monotonic") as mock_clock:
+            mock_settings.search_chain_concurrent = False
+            mock_settings.search_breaker_threshold = 1
+            mock_settings.search_breaker_cooldown = 60.0
+            mock_clock.return_value = 1000.0
+            chain = SearchProviderChain([p1, p2])
+
+            chain.search("query")  # P1 fails once → open
+            chain.search("query")  # skipped
+            mock_clock.return_value = 1061.0
+            p1.search.return_value = ["https://p1.com"]
+            assert chain.search("query") == ["https://p1.com"]  # probe succeeds
+
+        assert p1.search.call_count == 2
+
+    def test_drops_invalid_urls(self):
+        from backend.agent.search_providers import SearchProviderChain
+
+        p1 = self._make_provider("P1", ["javascript:alert(1)", "/relative", "https://bad url"])
+        p2 = self._make_provider("P2", ["javascript:alert(1)", "https://ok.com"])
+        chain = SearchProviderChain([p1, p2])
+
+        assert chain.search("query") == ["https://ok.com"]
+
+    def test_empty_query_skips_providers(self):
+        from backend.agent.search_providers import SearchProviderChain
+
+        p1 = self._make_provider("P1", ["https://p1.com"])
+        chain = SearchProviderChain([p1])
+
+        for query in ("", "   ", '""', "N/A"):
+            assert chain.search(query) == []
+
+        p1.search.assert_not_called()
+
+    def test_concurrent_mode_prefers_priority_order(self):
+        from backend.agent.search_providers import SearchProviderChain
+
+        p1 = self._make_provider("P1", [])
+        p2 = self._make_provider("P2", ["https://p2.com"])
+        p3 = self._make_provider("P3", ["https://p3.com"])
+        started = threading.Barrier(3, timeout=5)
+
+        def _wait_for_all(returns):
+            def _search(*args, **kwargs):
+                started.wait()  # every provider is running at the same time
+                return returns
+            return _search
+
+        for p in (p1, p2, p3):
+            p.search.side_effect = _wait_for_all(p.search.return_value)
+
+        with patch("backend.agent.search_providers.settings") as mock_settings:
+            mock_settings.search_chain_concurrent = True
+            mock_settings.search_breaker_threshold = 3
+            mock_settings.search_breaker_cooldown = 60.0
+            result = SearchProviderChain([p1, p2, p3]).search("query", max_results=4)
+
+        assert result == ["https://p2.com"]
+        for p in (p1, p2, p3):
+            p.search.assert_called_once_with("query", max_results=4)
+
 
 # ===========================================================================
 # build_default_chain
@@ -385,6 +747,9 @@ class TestBuildDefaultChain:
         assert "SearXNG" in names
         assert "DuckDuckGo" in names
         assert "Brave" not in names  # no key configured
+        searxng = next(p for p in chain._providers if isinstance(p, SearXNGProvider))
+        assert searxng._client is chain._client
+        chain.close()
 
     def test_includes_brave_when_key_configured(self):
         from backend.agent.search_providers import BraveSearchProvider, build_default_chain
@@ -396,6 +761,19 @@ class TestBuildDefaultChain:
 
         names = [p.name for p in chain._providers]
         assert "Brave" in names
+        http_providers = [p for p in chain._providers if p.name in ("Brave", "SearXNG")]
+        assert all(p._client is chain._client for p in http_providers)
+        chain.close()
+
+    def test_shared_client_uses_http2_when_h2_installed(self):
+        from backend.agent.search_providers import build_default_chain
+
+        for h2_module, expected in ((types.ModuleType("h2"), True), (None, False)):
+            with patch.dict(sys.modules, {"h2": h2_module}), \
+                 patch("backend.agent.search_providers.httpx") as mock_httpx:
+                build_default_chain()
+
+            assert mock_httpx.Client.call_args.kwargs["http2"] is expected
 
 
 # ===========================================================================